@@ -34,6 +34,7 @@ from ols.src.query_helpers.attachment_appender import append_attachments_to_quer
 from ols.src.query_helpers.docs_summarizer import DocsSummarizer
 from ols.src.query_helpers.question_validator import QuestionValidator
 from ols.utils import errors_parsing, suid
+from ols.utils.redactor import Redactor
 from ols.utils.token_handler import PromptTooLongError
 
 logger = logging.getLogger(__name__)
@@ -384,13 +385,17 @@ def store_conversation_history(
         )
 
 
-def redact_query(conversation_id: str, llm_request: LLMRequest) -> LLMRequest:
+def redact_query(
+    conversation_id: str,
+    llm_request: LLMRequest,
+    redactor: Optional[Redactor] = None,
+) -> LLMRequest:
     """Redact query using query_redactor, raise HTTPException in case of any problem."""
+    if redactor is None:
+        redactor = config.query_redactor
     try:
         logger.debug("Redacting query for conversation %s", conversation_id)
-        llm_request.query = config.query_redactor.redact(
-            conversation_id, llm_request.query
-        )
+        llm_request.query = redactor.redact(conversation_id, llm_request.query)
         return llm_request
     except Exception as redactor_error:
         logger.error(
@@ -408,19 +413,21 @@ def redact_query(conversation_id: str, llm_request: LLMRequest) -> LLMRequest:
 
 
 def redact_attachments(
-    conversation_id: str, attachments: list[Attachment]
+    conversation_id: str,
+    attachments: list[Attachment],
+    redactor: Optional[Redactor] = None,
 ) -> list[Attachment]:
     """Redact all attachments using query_redactor, raise HTTPException in case of any problem."""
     logger.debug("Redacting attachments for conversation %s", conversation_id)
+    if redactor is None:
+        redactor = config.query_redactor
 
     try:
         redacted_attachments = []
         for attachment in attachments:
             # might be possible to change attachments "in situ" but it might
             # confuse developers
-            redacted_content = config.query_redactor.redact(
-                conversation_id, attachment.content
-            )
+            redacted_content = redactor.redact(conversation_id, attachment.content)
             redacted_attachment = Attachment(
                 attachment_type=attachment.attachment_type,
                 content_type=attachment.content_type,
@@ -580,9 +587,10 @@ def store_transcript(
         "attachments": [attachment.model_dump() for attachment in attachments],
     }
 
-    # stores feedback in a file under unique uuid
+    # stores feedback in a file under unique uuid; the whole document is
+    # encoded at once (json.dump would issue a write per encoded chunk)
     transcript_file_path = transcripts_path / f"{suid.get_suid()}.json"
     with open(transcript_file_path, "w", encoding="utf-8") as transcript_file:
-        json.dump(data_to_store, transcript_file)
+        transcript_file.write(json.dumps(data_to_store))
 
     logger.debug("transcript stored in '%s'", transcript_file_path)
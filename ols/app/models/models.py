@@ -1,6 +1,5 @@
 """Data models representing payloads for REST API calls."""
 
-from collections import OrderedDict
 from typing import Optional, Self
 
 from pydantic import BaseModel, field_validator, model_validator
@@ -145,15 +144,10 @@ class ReferencedDocument:
 
         Order of items is preserved.
         """
-        return list(
-            OrderedDict(
-                (
-                    rag_chunk.doc_url,
-                    ReferencedDocument(rag_chunk.doc_url, rag_chunk.doc_title),
-                )
-                for rag_chunk in rag_chunks
-            ).values()
-        )
+        # dict keeps the position of the first occurrence of each URL, so
+        # documents are validated once per URL, not once per chunk
+        titles = {rag_chunk.doc_url: rag_chunk.doc_title for rag_chunk in rag_chunks}
+        return [ReferencedDocument(url, title) for url, title in titles.items()]
 
 
 class LLMResponse(BaseModel):
@@ -501,7 +495,7 @@ class AuthorizationResponse(BaseModel):
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class RagChunk:
     """Model representing a RAG chunk.
 
@@ -17,6 +17,7 @@ import sys
 import tarfile
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import kubernetes
@@ -49,8 +50,12 @@ INGRESS_TIMEOUT = 30  # seconds
 INGRESS_BASE_DELAY = 60  # exponential backoff parameter
 INGRESS_MAX_RETRIES = 3  # exponential backoff parameter
 REDHAT_SSO_TIMEOUT = 5  # seconds
+PARALLEL_DELETE_THRESHOLD = 16  # files, fewer files are deleted sequentially
+PARALLEL_DELETE_MAX_WORKERS = 8
 
 OLS_USER_DATA_MAX_SIZE = 100 * 1024 * 1024  # 100 MiB
+TARBALL_COPY_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+DISABLE_COLLECTOR_FILE_NAME = "disable_collector"
 USER_AGENT = "openshift-lightspeed-operator/user-data-collection cluster/{cluster_id}"
 logging.basicConfig(
     level=udc_config.log_level,
@@ -175,7 +180,11 @@ def package_files_into_tarball(
         BytesIO object representing the tarball.
     """
     tarball_io = io.BytesIO()
-    with tarfile.open(fileobj=tarball_io, mode="w:gz") as tar:
+    # bigger copy buffer means fewer round-trips between reading the
+    # files and compressing them
+    with tarfile.open(
+        fileobj=tarball_io, mode="w:gz", copybufsize=TARBALL_COPY_BUFFER_SIZE
+    ) as tar:
         # arcname parameter is set to a stripped path to avoid including
         # the full path of the root dir
         for file_path in file_paths:
@@ -220,6 +229,51 @@ def exponential_backoff_decorator(max_retries: int, base_delay: int) -> Callable
     return decorator
 
 
+# authentication headers are shared by all upload attempts within one
+# data collection run, see `get_ingress_auth_headers`
+_ingress_auth_headers: dict[str, str | bytes] | None = None
+
+
+def get_ingress_auth_headers() -> dict[str, str | bytes]:
+    """Get headers used to authenticate against the Ingress.
+
+    Headers are computed only once and reused for subsequent calls, so
+    the token is not regenerated for every chunk or upload retry. Call
+    `reset_ingress_auth_headers` to force a new token.
+
+    Returns:
+        Headers with authorization (and user-agent, if applicable).
+    """
+    global _ingress_auth_headers  # pylint: disable=global-statement
+    if _ingress_auth_headers is not None:
+        return _ingress_auth_headers
+
+    headers: dict[str, str | bytes]
+    if udc_config.cp_offline_token:
+        logger.debug("using CP offline token to generate refresh token")
+        token = access_token_from_offline_token(udc_config.cp_offline_token)
+        # when authenticating with token, user-agent is not accepted
+        # causing "UHC services authentication failed"
+        headers = {"Authorization": f"Bearer {token}"}
+    else:
+        logger.debug("using cluster pull secret to authenticate")
+        cluster_id = K8sClientSingleton.get_cluster_id()
+        token = get_cloud_openshift_pull_secret()
+        headers = {
+            "User-Agent": USER_AGENT.format(cluster_id=cluster_id),
+            "Authorization": f"Bearer {token}",
+        }
+
+    _ingress_auth_headers = headers
+    return headers
+
+
+def reset_ingress_auth_headers() -> None:
+    """Drop cached Ingress authentication headers."""
+    global _ingress_auth_headers  # pylint: disable=global-statement
+    _ingress_auth_headers = None
+
+
 @exponential_backoff_decorator(
     max_retries=INGRESS_MAX_RETRIES, base_delay=INGRESS_BASE_DELAY
 )
@@ -237,27 +291,14 @@ def upload_data_to_ingress(tarball: io.BytesIO) -> requests.Response:
     payload = {
         "file": (
             "ols.tgz",
-            tarball.read(),
+            # use whole buffer, not just the unread rest, to be able to
+            # send the same data again on retry
+            tarball.getvalue(),
             "application/vnd.redhat.openshift.periodic+tar",
         ),
     }
 
-    headers: dict[str, str | bytes]
-
-    if udc_config.cp_offline_token:
-        logger.debug("using CP offline token to generate refresh token")
-        token = access_token_from_offline_token(udc_config.cp_offline_token)
-        # when authenticating with token, user-agent is not accepted
-        # causing "UHC services authentication failed"
-        headers = {"Authorization": f"Bearer {token}"}
-    else:
-        logger.debug("using cluster pull secret to authenticate")
-        cluster_id = K8sClientSingleton.get_cluster_id()
-        token = get_cloud_openshift_pull_secret()
-        headers = {
-            "User-Agent": USER_AGENT.format(cluster_id=cluster_id),
-            "Authorization": f"Bearer {token}",
-        }
+    headers = get_ingress_auth_headers()
 
     with requests.Session() as s:
         s.headers = headers
@@ -274,6 +315,12 @@ def upload_data_to_ingress(tarball: io.BytesIO) -> requests.Response:
             response.status_code,
             response.text,
         )
+        if response.status_code in {
+            requests.codes.unauthorized,
+            requests.codes.forbidden,
+        }:
+            # token might be expired, get new one for next attempt
+            reset_ingress_auth_headers()
         raise requests.exceptions.HTTPError(
             f"data upload failed with response code: {response.status_code}"
         )
@@ -284,17 +331,35 @@ def upload_data_to_ingress(tarball: io.BytesIO) -> requests.Response:
     return response
 
 
+def delete_file(file_path: pathlib.Path) -> None:
+    """Delete file from the provided path.
+
+    Args:
+        file_path: Path to the file to be deleted.
+    """
+    logger.debug("removing '%s'", file_path)
+    file_path.unlink()
+    if file_path.exists():
+        logger.error("failed to remove '%s'", file_path)
+
+
 def delete_data(file_paths: list[pathlib.Path]) -> None:
     """Delete files from the provided paths.
 
+    Bigger amount of files is deleted in parallel as each unlink can be
+    a network round-trip on some persistent volumes.
+
     Args:
         file_paths: List of paths to the files to be deleted.
     """
-    for file_path in file_paths:
-        logger.debug("removing '%s'", file_path)
-        file_path.unlink()
-        if file_path.exists():
-            logger.error("failed to remove '%s'", file_path)
+    if len(file_paths) < PARALLEL_DELETE_THRESHOLD:
+        for file_path in file_paths:
+            delete_file(file_path)
+        return
+
+    with ThreadPoolExecutor(max_workers=PARALLEL_DELETE_MAX_WORKERS) as executor:
+        # consume the results to propagate exceptions
+        list(executor.map(delete_file, file_paths))
 
 
 def chunk_data(
@@ -340,6 +405,8 @@ def gather_ols_user_data(data_path: str) -> None:
             data_path,
         )
         logger.debug("collected files: %s", collected_files)
+        # start with fresh authentication for each collection run
+        reset_ingress_auth_headers()
         for i, data_chunk in enumerate(data_chunks):
             logger.info("uploading data chunk %d/%d", i + 1, len(data_chunks))
             tarball = package_files_into_tarball(data_chunk, path_to_strip=data_path)
@@ -388,18 +455,15 @@ def ensure_data_dir_is_not_bigger_than_defined(
 # NOTE: This condition is here mainly to have a way how to influence
 # when the collector is running in the e2e tests. It is not meant to be
 # used in the production.
-def disabled_by_file() -> bool:
+def disabled_by_file(disable_collector_file: str) -> bool:
     """Check if the data collection is disabled by a file.
 
     Pure existence of the file `disable_collector` in the root of the
-    user data dir is enough to disable the data collection.
+    user data dir is enough to disable the data collection. The path
+    to the file is constant during the whole run, so it is passed
+    precomputed by the caller.
     """
-    if udc_config.data_storage is None:
-        logger.warning(
-            "Data storage path is None, cannot check for disable_collector file."
-        )
-        return False
-    return (udc_config.data_storage / "disable_collector").exists()
+    return os.path.exists(disable_collector_file)
 
 
 if __name__ == "__main__":
@@ -409,10 +473,13 @@ if __name__ == "__main__":
             INITIAL_WAIT,
         )
         time.sleep(INITIAL_WAIT)
+    # data storage path is constant during the whole run
+    data_storage = udc_config.data_storage.as_posix()
+    disable_collector_file = os.path.join(data_storage, DISABLE_COLLECTOR_FILE_NAME)
     while True:
-        if not disabled_by_file():
-            gather_ols_user_data(udc_config.data_storage.as_posix())
-            ensure_data_dir_is_not_bigger_than_defined()
+        if not disabled_by_file(disable_collector_file):
+            gather_ols_user_data(data_storage)
+            ensure_data_dir_is_not_bigger_than_defined(data_storage)
         else:
             logger.info("disabled by control file, skipping data collection")
         time.sleep(udc_config.collection_interval)
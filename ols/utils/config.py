@@ -103,6 +103,14 @@ class AppConfig:
         config.validate_yaml()
         return config
 
+    def reload_from_config(self, config: config_model.Config) -> None:
+        """Reload the configuration from already validated configuration."""
+        self.config = config
+        # reset the query filters and rag index to not use cached
+        # values
+        self._query_filters = None
+        self._rag_index = None
+
     def reload_from_yaml_file(
         self,
         config_file: str,
@@ -112,13 +120,11 @@ class AppConfig:
         """Reload the configuration from the YAML file."""
         try:
             with open(config_file, encoding="utf-8") as f:
-                self.config = self._load_config_from_yaml_stream(
-                    f, ignore_llm_secrets, ignore_missing_certs
+                self.reload_from_config(
+                    self._load_config_from_yaml_stream(
+                        f, ignore_llm_secrets, ignore_missing_certs
+                    )
                 )
-            # reset the query filters and rag index to not use cached
-            # values
-            self._query_filters = None
-            self._rag_index = None
         except Exception as e:
             print(f"Failed to load config file {config_file}: {e!s}")
             print(traceback.format_exc())
@@ -1,13 +1,23 @@
 """Pyroscope handling utility functions."""
 
 import logging
+import socket
 import threading
 from typing import Any
-
-import requests
+from urllib.parse import urlsplit
 
 from ols.runners.uvicorn import start_uvicorn
 
+# timeout for check if Pyroscope server is reachable
+PYROSCOPE_CONNECTION_TIMEOUT = 2  # seconds
+
+
+def pyroscope_server_address(url: str) -> tuple[str, int]:
+    """Get host and port of Pyroscope server from its URL."""
+    parts = urlsplit(url)
+    default_port = 443 if parts.scheme == "https" else 80
+    return parts.hostname or "", parts.port or default_port
+
 
 def start_with_pyroscope_enabled(
     config: Any,
@@ -15,33 +25,30 @@ def start_with_pyroscope_enabled(
 ) -> None:
     """Start the application using pyroscope."""
     try:
-
-        response = requests.get(config.dev_config.pyroscope_url, timeout=60)
-        if response.status_code == requests.codes.ok:
-            logger.info(
-                "Pyroscope server is reachable at %s", config.dev_config.pyroscope_url
-            )
-            # pylint: disable=C0415
-            import pyroscope
-
-            pyroscope.configure(
-                application_name="lightspeed-service",
-                server_address=config.dev_config.pyroscope_url,
-                oncpu=True,
-                gil_only=True,
-                enable_logging=True,
-            )
-            with pyroscope.tag_wrapper({"main": "main_method"}):
-                # create and start the rag_index_thread
-                rag_index_thread = threading.Thread(target=config.rag_index)
-                rag_index_thread.start()
-
-                # start the Uvicorn server
-                start_uvicorn(config)
-        else:
-            logger.info(
-                "Failed to reach Pyroscope server. Status code: %d",
-                response.status_code,
-            )
-    except requests.exceptions.RequestException as e:
+        # just check that server accepts connections, full HTTP request
+        # is not needed for that
+        address = pyroscope_server_address(config.dev_config.pyroscope_url)
+        with socket.create_connection(address, timeout=PYROSCOPE_CONNECTION_TIMEOUT):
+            pass
+    except (OSError, ValueError) as e:
         logger.info("Error connecting to Pyroscope server: %s", str(e))
+        return
+
+    logger.info("Pyroscope server is reachable at %s", config.dev_config.pyroscope_url)
+    # pylint: disable=C0415
+    import pyroscope
+
+    pyroscope.configure(
+        application_name="lightspeed-service",
+        server_address=config.dev_config.pyroscope_url,
+        oncpu=True,
+        gil_only=True,
+        enable_logging=True,
+    )
+    with pyroscope.tag_wrapper({"main": "main_method"}):
+        # create and start the rag_index_thread
+        rag_index_thread = threading.Thread(target=config.rag_index)
+        rag_index_thread.start()
+
+        # start the Uvicorn server
+        start_uvicorn(config)
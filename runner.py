@@ -80,8 +80,13 @@ if __name__ == "__main__":
             "in the `dev_config` section of the configuration file."
         )
     # create and start the rag_index_thread - allows loading index in
-    # parallel with starting the Uvicorn server
-    rag_index_thread = threading.Thread(target=load_index)
+    # parallel with starting the Uvicorn server; the index has to live in
+    # this process (readiness probe checks it), so a process pool can't be
+    # used here. Daemon thread does not block the shutdown when the index
+    # loading is still in progress.
+    rag_index_thread = threading.Thread(
+        target=load_index, name="rag_index_loader", daemon=True
+    )
     rag_index_thread.start()
 
     # start the Uvicorn server
@@ -3,3 +3,6 @@
 # embeddings metadata
 OCP_DOCS_ROOT_URL = "https://docs.openshift.com/container-platform"
 OCP_DOCS_VERSION = "4.15"
+
+# configuration used by integration tests
+INTEGRATION_TESTS_CONFIG = "tests/config/config_for_integration_tests.yaml"
@@ -1,11 +1,68 @@
 """Configuration for integration tests."""
 
+import copy
+
 import pytest
+from fastapi.testclient import TestClient
 
 from ols import config
+from tests.constants import INTEGRATION_TESTS_CONFIG
+from tests.mock_classes.mock_langchain_interface import mock_langchain_interface
+from tests.mock_classes.mock_llm_chain import mock_llm_chain
+from tests.mock_classes.mock_llm_loader import mock_llm_loader
 
 
 @pytest.fixture(scope="function", autouse=True)
 def ensure_empty_config_for_each_integration_test_by_default():
     """Set up fixture for all integration tests."""
     config.reload_empty()
+
+
+@pytest.fixture(scope="session")
+def _parsed_config():
+    """Parse and validate the integration tests configuration once per session."""
+    config.reload_from_yaml_file(INTEGRATION_TESTS_CONFIG)
+    return copy.deepcopy(config.config)
+
+
+@pytest.fixture
+def _integration_config(_parsed_config):
+    """Use fresh copy of the integration tests configuration in test."""
+    config.reload_from_config(copy.deepcopy(_parsed_config))
+
+
+@pytest.fixture(scope="session")
+def client(_parsed_config):
+    """Test client shared by all integration tests in the session."""
+    config.reload_from_config(copy.deepcopy(_parsed_config))
+
+    # app.main need to be imported after the configuration is read
+    from ols.app.main import app  # pylint: disable=C0415
+
+    # entering the client keeps one event loop portal running for the whole
+    # session instead of starting a new one for every request
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def _ml_factory():
+    """Construct mocked LangChainInterface class once per session."""
+    return mock_langchain_interface("test response")
+
+
+@pytest.fixture
+def ml_instance(_ml_factory):
+    """Provide mocked LangChainInterface returning test response."""
+    return _ml_factory()
+
+
+@pytest.fixture
+def _patched_llm(monkeypatch, ml_instance):
+    """Replace LLM used by query helpers with mock returning test response."""
+    monkeypatch.setattr(
+        "ols.src.query_helpers.docs_summarizer.LLMChain", mock_llm_chain(None)
+    )
+    monkeypatch.setattr(
+        "ols.src.query_helpers.query_helper.load_llm", mock_llm_loader(ml_instance)
+    )
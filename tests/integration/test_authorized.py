@@ -4,8 +4,6 @@ import logging
 from unittest.mock import patch
 
 import pytest
-import requests
-from fastapi.testclient import TestClient
 
 from ols import config, constants
 from ols.app.models.config import LoggingConfig
@@ -17,14 +15,8 @@ from tests.mock_classes.mock_k8s_api import (
 
 
 @pytest.fixture(scope="function", autouse=True)
-def _setup():
-    """Setups the test client."""
-    config.reload_from_yaml_file("tests/config/config_for_integration_tests.yaml")
-
-    # app.main need to be imported after the configuration is read
-    from ols.app.main import app  # pylint: disable=C0415
-
-    pytest.client = TestClient(app)
+def _setup(_integration_config):
+    """Setups the configuration, the test client is shared by the whole session."""
 
 
 @pytest.fixture
@@ -42,7 +34,7 @@ def _enabled_auth():
 
 
 @pytest.mark.usefixtures("_disabled_auth")
-def test_post_authorized_disabled(caplog):
+def test_post_authorized_disabled(caplog, client):
     """Check the REST API /v1/query with POST HTTP method with authentication disabled."""
     # perform POST request with authentication disabled
     logging_config = LoggingConfig(app_log_level="warning")
@@ -51,8 +43,8 @@ def test_post_authorized_disabled(caplog):
     logger = logging.getLogger("ols")
     logger.handlers = [caplog.handler]  # add caplog handler to logger
 
-    response = pytest.client.post("/authorized")
-    assert response.status_code == requests.codes.ok
+    response = client.post("/authorized")
+    assert response.status_code == 200
 
     # check the response payload
     assert response.json() == {
@@ -66,7 +58,7 @@ def test_post_authorized_disabled(caplog):
 
 
 @pytest.mark.usefixtures("_disabled_auth")
-def test_post_authorized_disabled_with_logging_suppressed(caplog):
+def test_post_authorized_disabled_with_logging_suppressed(caplog, client):
     """Check the REST API /v1/query with POST HTTP method with the auth warning suppressed."""
     # perform POST request with authentication disabled
     logging_config = LoggingConfig(app_log_level="warning")
@@ -76,8 +68,8 @@ def test_post_authorized_disabled_with_logging_suppressed(caplog):
     logger = logging.getLogger("ols")
     logger.handlers = [caplog.handler]  # add caplog handler to logger
 
-    response = pytest.client.post("/authorized")
-    assert response.status_code == requests.codes.ok
+    response = client.post("/authorized")
+    assert response.status_code == 200
 
     # check the response payload
     assert response.json() == {
@@ -91,17 +83,17 @@ def test_post_authorized_disabled_with_logging_suppressed(caplog):
 
 
 @pytest.mark.usefixtures("_enabled_auth")
-def test_post_authorized_no_token():
+def test_post_authorized_no_token(client):
     """Check the REST API /v1/query with POST HTTP method when no payload is posted."""
     # perform POST request without any payload
-    response = pytest.client.post("/authorized")
+    response = client.post("/authorized")
     assert response.status_code == 401
 
 
 @pytest.mark.usefixtures("_enabled_auth")
 @patch("ols.src.auth.k8s.K8sClientSingleton.get_authn_api")
 @patch("ols.src.auth.k8s.K8sClientSingleton.get_authz_api")
-def test_is_user_authorized_valid_token(mock_authz_api, mock_authn_api):
+def test_is_user_authorized_valid_token(mock_authz_api, mock_authn_api, client):
     """Tests the is_user_authorized function with a mocked valid-token."""
     # Setup mock responses for valid token
     mock_authn_api.return_value.create_token_review.side_effect = (
@@ -110,11 +102,11 @@ def test_is_user_authorized_valid_token(mock_authz_api, mock_authn_api):
     mock_authz_api.return_value.create_subject_access_review.side_effect = (
         mock_subject_access_review_response
     )
-    response = pytest.client.post(
+    response = client.post(
         "/authorized",
         headers=[(b"authorization", b"Bearer valid-token")],
     )
-    assert response.status_code == requests.codes.ok
+    assert response.status_code == 200
     print(response.json())
 
     # check the response payload
@@ -124,7 +116,7 @@ def test_is_user_authorized_valid_token(mock_authz_api, mock_authn_api):
 @pytest.mark.usefixtures("_enabled_auth")
 @patch("ols.src.auth.k8s.K8sClientSingleton.get_authn_api")
 @patch("ols.src.auth.k8s.K8sClientSingleton.get_authz_api")
-def test_is_user_authorized_invalid_token(mock_authz_api, mock_authn_api):
+def test_is_user_authorized_invalid_token(mock_authz_api, mock_authn_api, client):
     """Test the is_user_authorized function with a mocked invalid-token."""
     # Setup mock responses for invalid token
     mock_authn_api.return_value.create_token_review.side_effect = (
@@ -134,7 +126,7 @@ def test_is_user_authorized_invalid_token(mock_authz_api, mock_authn_api):
         mock_subject_access_review_response
     )
 
-    response = pytest.client.post(
+    response = client.post(
         "/authorized",
         headers=[(b"authorization", b"Bearer invalid-token")],
     )
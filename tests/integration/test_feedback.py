@@ -3,8 +3,6 @@
 from unittest.mock import patch
 
 import pytest
-import requests
-from fastapi.testclient import TestClient
 
 from ols import config
 from ols.app.models.config import UserDataCollection
@@ -15,14 +13,8 @@ CONVERSATION_ID = suid.get_suid()
 
 
 @pytest.fixture(scope="function", autouse=True)
-def _setup():
-    """Setups the test client."""
-    config.reload_from_yaml_file("tests/config/config_for_integration_tests.yaml")
-
-    # app.main need to be imported after the configuration is read
-    from ols.app.main import app  # pylint: disable=C0415
-
-    pytest.client = TestClient(app)
+def _setup(_integration_config):
+    """Setups the configuration with disabled auth."""
     config.dev_config.disable_auth = True
 
 
@@ -41,28 +33,28 @@ def _with_enabled_feedback(tmpdir):
 
 
 @pytest.mark.usefixtures("_with_disabled_feedback")
-def test_feedback_endpoints_disabled_when_set_in_config():
+def test_feedback_endpoints_disabled_when_set_in_config(client):
     """Check if feedback endpoints are disabled when set in config."""
     # status endpoint is always available
-    response = pytest.client.get("/v1/feedback/status")
-    assert response.status_code == requests.codes.ok
+    response = client.get("/v1/feedback/status")
+    assert response.status_code == 200
 
-    response = pytest.client.post("/v1/feedback/", json={"a": 5})
-    assert response.status_code == requests.codes.forbidden
+    response = client.post("/v1/feedback/", json={"a": 5})
+    assert response.status_code == 403
 
 
 @pytest.mark.usefixtures("_with_enabled_feedback")
-def test_feedback_status():
+def test_feedback_status(client):
     """Check if feedback status is returned."""
-    response = pytest.client.get("/v1/feedback/status")
-    assert response.status_code == requests.codes.ok
+    response = client.get("/v1/feedback/status")
+    assert response.status_code == 200
     assert response.json() == {"functionality": "feedback", "status": {"enabled": True}}
 
 
 @pytest.mark.usefixtures("_with_enabled_feedback")
-def test_feedback():
+def test_feedback(client):
     """Check if feedback with correct format is accepted by the service."""
-    response = pytest.client.post(
+    response = client.post(
         "/v1/feedback",
         json={
             "conversation_id": CONVERSATION_ID,
@@ -71,14 +63,14 @@ def test_feedback():
             "sentiment": -1,
         },
     )
-    assert response.status_code == requests.codes.ok
+    assert response.status_code == 200
     assert response.json() == {"response": "feedback received"}
 
 
 @pytest.mark.usefixtures("_with_enabled_feedback")
-def test_feedback_improper_conversation_id():
+def test_feedback_improper_conversation_id(client):
     """Check if feedback with improper conversation ID is rejected."""
-    response = pytest.client.post(
+    response = client.post(
         "/v1/feedback",
         json={
             "conversation_id": "really-not-an-uuid",
@@ -87,13 +79,13 @@ def test_feedback_improper_conversation_id():
             "sentiment": -1,
         },
     )
-    assert response.status_code == requests.codes.unprocessable_entity
+    assert response.status_code == 422
 
 
 @pytest.mark.usefixtures("_with_enabled_feedback")
-def test_feedback_improper_sentiment():
+def test_feedback_improper_sentiment(client):
     """Check if feedback with improper sentiment value is rejected."""
-    response = pytest.client.post(
+    response = client.post(
         "/v1/feedback",
         json={
             "conversation_id": CONVERSATION_ID,
@@ -102,9 +94,9 @@ def test_feedback_improper_sentiment():
             "sentiment": -2,
         },
     )
-    assert response.status_code == requests.codes.unprocessable_entity
+    assert response.status_code == 422
 
-    response = pytest.client.post(
+    response = client.post(
         "/v1/feedback",
         json={
             "conversation_id": CONVERSATION_ID,
@@ -113,22 +105,22 @@ def test_feedback_improper_sentiment():
             "sentiment": "foo",
         },
     )
-    assert response.status_code == requests.codes.unprocessable_entity
+    assert response.status_code == 422
 
 
 @pytest.mark.usefixtures("_with_enabled_feedback")
-def test_feedback_wrong_request():
+def test_feedback_wrong_request(client):
     """Check if feedback with wrong payload (empty one) is not accepted by the service."""
-    response = pytest.client.post("/v1/feedback", json={})
+    response = client.post("/v1/feedback", json={})
     # for the request send w/o proper payload, the server
     # should respond with proper error code
-    assert response.status_code == requests.codes.unprocessable_entity
+    assert response.status_code == 422
 
 
 @pytest.mark.usefixtures("_with_enabled_feedback")
-def test_feedback_mandatory_fields_not_provided_filled_in_request():
+def test_feedback_mandatory_fields_not_provided_filled_in_request(client):
     """Check if feedback without mandatory fields is not accepted by the service."""
-    response = pytest.client.post(
+    response = client.post(
         "/v1/feedback",
         json={
             "conversation_id": CONVERSATION_ID,
@@ -138,26 +130,26 @@ def test_feedback_mandatory_fields_not_provided_filled_in_request():
     )
     # for the request send w/o proper payload, the server
     # should respond with proper error code
-    assert response.status_code == requests.codes.unprocessable_entity
+    assert response.status_code == 422
 
 
 @pytest.mark.usefixtures("_with_enabled_feedback")
-def test_feedback_no_payload_send():
+def test_feedback_no_payload_send(client):
     """Check if feedback without feedback payload."""
-    response = pytest.client.post("/v1/feedback")
+    response = client.post("/v1/feedback")
     # for the request send w/o payload, the server
     # should respond with proper error code
-    assert response.status_code == requests.codes.unprocessable_entity
+    assert response.status_code == 422
 
 
 @pytest.mark.usefixtures("_with_enabled_feedback")
-def test_feedback_error_raised():
+def test_feedback_error_raised(client):
     """Check if feedback endpoint raises an exception when storing feedback fails."""
     with patch(
         "ols.app.endpoints.feedback.store_feedback",
         side_effect=Exception("Test exception"),
     ):
-        response = pytest.client.post(
+        response = client.post(
             "/v1/feedback",
             json={
                 "conversation_id": CONVERSATION_ID,
@@ -166,4 +158,4 @@ def test_feedback_error_raised():
                 "sentiment": -1,
             },
         )
-        assert response.status_code == requests.codes.internal_server_error
+        assert response.status_code == 500
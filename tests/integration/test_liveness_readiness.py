@@ -1,51 +1,31 @@
 """Integration tests for /livenss and /readiness REST API endpoints."""
 
-import os
 from unittest.mock import patch
 
 import pytest
-import requests
-from fastapi.testclient import TestClient
 
-from ols import config
-from ols.constants import CONFIGURATION_FILE_NAME_ENV_VARIABLE
 
-
-# we need to patch the config file path to point to the test
-# config file before we import anything from main.py
 @pytest.fixture(scope="function", autouse=True)
-@patch.dict(
-    os.environ,
-    {
-        CONFIGURATION_FILE_NAME_ENV_VARIABLE: "tests/config/config_for_integration_tests.yaml"
-    },
-)
-def _setup():
-    """Setups the test client."""
-    config.reload_from_yaml_file("tests/config/config_for_integration_tests.yaml")
-
-    # app.main need to be imported after the configuration is read
-    from ols.app.main import app  # pylint: disable=C0415
-
-    pytest.client = TestClient(app)
+def _setup(_integration_config):
+    """Setups the configuration, the test client is shared by the whole session."""
 
 
-def test_liveness():
+def test_liveness(client):
     """Test handler for /liveness REST API endpoint."""
-    response = pytest.client.get("/liveness")
-    assert response.status_code == requests.codes.ok
+    response = client.get("/liveness")
+    assert response.status_code == 200
     assert response.json() == {"alive": True}
 
 
-def test_readiness():
+def test_readiness(client):
     """Test handler for /readiness REST API endpoint."""
     # index is not ready
     with (
         patch("ols.app.endpoints.health.llm_is_ready", return_value=True),
         patch("ols.app.endpoints.health.index_is_ready", return_value=False),
     ):
-        response = pytest.client.get("/readiness")
-        assert response.status_code == requests.codes.service_unavailable
+        response = client.get("/readiness")
+        assert response.status_code == 503
         assert response.json() == {
             "detail": {
                 "response": "Service is not ready",
@@ -58,8 +38,8 @@ def test_readiness():
         patch("ols.app.endpoints.health.llm_is_ready", return_value=False),
         patch("ols.app.endpoints.health.index_is_ready", return_value=True),
     ):
-        response = pytest.client.get("/readiness")
-        assert response.status_code == requests.codes.service_unavailable
+        response = client.get("/readiness")
+        assert response.status_code == 503
         assert response.json() == {
             "detail": {"response": "Service is not ready", "cause": "LLM is not ready"}
         }
@@ -69,6 +49,6 @@ def test_readiness():
         patch("ols.app.endpoints.health.llm_is_ready", return_value=True),
         patch("ols.app.endpoints.health.index_is_ready", return_value=True),
     ):
-        response = pytest.client.get("/readiness")
-        assert response.status_code == requests.codes.ok
+        response = client.get("/readiness")
+        assert response.status_code == 200
         assert response.json() == {"ready": True, "reason": "service is ready"}
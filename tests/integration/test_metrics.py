@@ -1,17 +1,12 @@
 """Integration tests for metrics exposed by the service."""
 
 import logging
-import os
 import re
-from unittest.mock import patch
 
 import pytest
-import requests
-from fastapi.testclient import TestClient
 
 from ols import config
 from ols.app.models.config import LoggingConfig
-from ols.constants import CONFIGURATION_FILE_NAME_ENV_VARIABLE
 from ols.utils.logging_configurator import configure_logging
 
 # counters that are expected to be part of metrics
@@ -25,49 +20,52 @@ expected_counters = (
     "ols_provider_model_configuration",
 )
 
+# one pass over the text is enough to find all expected counters
+counter_names_pattern = re.compile("|".join(map(re.escape, expected_counters)))
+counters_pattern = re.compile(f"({counter_names_pattern.pattern}) ")
 
-# we need to patch the config file path to point to the test
-# config file before we import anything from main.py
-@pytest.fixture(scope="function", autouse=True)
-@patch.dict(
-    os.environ,
-    {
-        CONFIGURATION_FILE_NAME_ENV_VARIABLE: "tests/config/config_for_integration_tests.yaml"
-    },
-)
-def _setup():
-    """Setups the test client."""
-    config.reload_from_yaml_file("tests/config/config_for_integration_tests.yaml")
-    from ols.app.main import app  # pylint: disable=C0415
 
-    pytest.client = TestClient(app)
+@pytest.fixture(scope="function", autouse=True)
+def _setup(_integration_config):
+    """Setups the configuration, the test client is shared by the whole session."""
 
 
 def retrieve_metrics(client):
     """Retrieve all service metrics."""
-    response = pytest.client.get("/metrics")
+    response = client.get("/metrics")
 
     # check that the /metrics endpoint is correct and we got
     # some response
-    assert response.status_code == requests.codes.ok
+    assert response.status_code == 200
     assert response.text is not None
 
     # return response text (it is not JSON!)
     return response.text
 
 
-def test_metrics():
-    """Check if service provides metrics endpoint with some expected counters."""
-    response_text = retrieve_metrics(pytest.client)
+def assert_counters_present(response_text):
+    """Check that all expected counters are part of metrics."""
+    missing_counters = set(expected_counters) - set(
+        counters_pattern.findall(response_text)
+    )
+    assert (
+        not missing_counters
+    ), f"Counters {missing_counters} not found in {response_text}"
 
-    # check if all counters are present
-    for expected_counter in expected_counters:
-        assert (
-            f"{expected_counter} " in response_text
-        ), f"Counter {expected_counter} not found in {response_text}"
+
+@pytest.fixture(scope="module")
+def metrics_counters(client):
+    """Retrieve metrics once and find counters shared by all test cases."""
+    return set(counters_pattern.findall(retrieve_metrics(client)))
 
 
-def test_metrics_with_debug_log(caplog):
+@pytest.mark.parametrize("counter", expected_counters)
+def test_metrics(metrics_counters, counter):
+    """Check if service provides metrics endpoint with some expected counters."""
+    assert counter in metrics_counters
+
+
+def test_metrics_with_debug_log(client, caplog):
     """Check if service provides metrics endpoint with some expected counters."""
     logging_config = LoggingConfig(app_log_level="debug")
 
@@ -75,21 +73,17 @@ def test_metrics_with_debug_log(caplog):
     logger = logging.getLogger("ols")
     logger.handlers = [caplog.handler]  # add caplog handler to logger
 
-    response_text = retrieve_metrics(pytest.client)
+    response_text = retrieve_metrics(client)
 
     # check if all counters are present
-    for expected_counter in expected_counters:
-        assert (
-            f"{expected_counter} " in response_text
-        ), f"Counter {expected_counter} not found in {response_text}"
+    assert_counters_present(response_text)
 
     # check if the metrics are also found in the log
-    captured_out = caplog.text
-    for expected_counter in expected_counters:
-        assert expected_counter in captured_out
+    found_in_log = set(counter_names_pattern.findall(caplog.text))
+    assert found_in_log == set(expected_counters)
 
 
-def test_metrics_with_debug_logging_suppressed(caplog):
+def test_metrics_with_debug_logging_suppressed(client, caplog):
     """Check if service provides metrics endpoint with some counters and log output suppressed."""
     logging_config = LoggingConfig(app_log_level="debug")
     config.ols_config.logging_config.suppress_metrics_in_log = True
@@ -99,18 +93,13 @@ def test_metrics_with_debug_logging_suppressed(caplog):
     logger = logging.getLogger("ols")
     logger.handlers = [caplog.handler]  # add caplog handler to logger
 
-    response_text = retrieve_metrics(pytest.client)
+    response_text = retrieve_metrics(client)
 
     # check if all counters are present
-    for expected_counter in expected_counters:
-        assert (
-            f"{expected_counter} " in response_text
-        ), f"Counter {expected_counter} not found in {response_text}"
+    assert_counters_present(response_text)
 
     # check if the metrics are NOT found in the log
-    captured_out = caplog.text
-    for expected_counter in expected_counters:
-        assert expected_counter not in captured_out
+    assert counter_names_pattern.search(caplog.text) is None
 
 
 def get_counter_value(client, counter_name, path, status_code):
@@ -131,42 +120,42 @@ def get_counter_value(client, counter_name, path, status_code):
     raise Exception(f"Counter {counter_name} was not found in metrics")
 
 
-def test_rest_api_call_counter_ok_status():
+def test_rest_api_call_counter_ok_status(client):
     """Check if REST API call counter works as expected, label with 200 OK status."""
     endpoint = "/liveness"
 
     # initialize counter with label by calling endpoint
-    pytest.client.get(endpoint)
-    old = get_counter_value(pytest.client, "ols_rest_api_calls_total", endpoint, "200")
+    client.get(endpoint)
+    old = get_counter_value(client, "ols_rest_api_calls_total", endpoint, "200")
 
     # call some REST API endpoint
-    pytest.client.get(endpoint)
-    new = get_counter_value(pytest.client, "ols_rest_api_calls_total", endpoint, "200")
+    client.get(endpoint)
+    new = get_counter_value(client, "ols_rest_api_calls_total", endpoint, "200")
 
     # compare counters
     assert new == old + 1, "Counter has not been updated properly"
 
 
-def test_rest_api_call_counter_not_found_status():
+def test_rest_api_call_counter_not_found_status(client):
     """Check if REST API call counter works as expected, label with 404 NotFound status."""
     endpoint = "/this-does-not-exists"
 
     # initialize counter with label
-    pytest.client.get(endpoint)
-    old = get_counter_value(pytest.client, "ols_rest_api_calls_total", endpoint, "404")
+    client.get(endpoint)
+    old = get_counter_value(client, "ols_rest_api_calls_total", endpoint, "404")
 
     # call some REST API endpoint
-    pytest.client.get(endpoint)
-    new = get_counter_value(pytest.client, "ols_rest_api_calls_total", endpoint, "404")
+    client.get(endpoint)
+    new = get_counter_value(client, "ols_rest_api_calls_total", endpoint, "404")
 
     # compare counters
     # just the NotFound value should change
     assert new == old + 1, "Counter for 404 NotFound  has not been updated properly"
 
 
-def test_metrics_duration():
+def test_metrics_duration(client):
     """Check if service provides metrics for durations."""
-    response_text = retrieve_metrics(pytest.client)
+    response_text = retrieve_metrics(client)
 
     # duration histograms are expected to be part of metrics
 
@@ -186,9 +175,9 @@ def test_metrics_duration():
     assert re.findall(pattern, response_text)
 
 
-def test_provider_model_configuration_metrics():
+def test_provider_model_configuration_metrics(client):
     """Check if provider_model_configuration metrics shows the expected information."""
-    response_text = retrieve_metrics(pytest.client)
+    response_text = retrieve_metrics(client)
     print(response_text)
     for provider in ("bam", "openai"):
         for model in ("m1", "m2"):
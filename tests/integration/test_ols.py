@@ -4,8 +4,6 @@ import logging
 from unittest.mock import patch
 
 import pytest
-import requests
-from fastapi.testclient import TestClient
 from langchain.schema import AIMessage, HumanMessage
 
 from ols import config, constants
@@ -23,21 +21,26 @@ from tests.mock_classes.mock_llm_chain import mock_llm_chain
 from tests.mock_classes.mock_llm_loader import mock_llm_loader
 
 
-@pytest.fixture(scope="function")
-def _setup():
-    """Setups the test client."""
-    config.reload_from_yaml_file("tests/config/config_for_integration_tests.yaml")
+@pytest.fixture(scope="function", autouse=True)
+def _setup(_integration_config):
+    """Setups the configuration and starts with empty conversation cache."""
+    config._conversation_cache = None
 
-    # app.main need to be imported after the configuration is read
-    from ols.app.main import app  # pylint: disable=C0415
 
-    pytest.client = TestClient(app)
+@pytest.fixture
+def mock_validate_question():
+    """Let every question pass the validation; calls are recorded."""
+    with patch(
+        "ols.app.endpoints.ols.QuestionValidator.validate_question",
+        return_value=constants.SUBJECT_ALLOWED,
+    ) as mock:
+        yield mock
 
 
-def test_post_question_on_unexpected_payload(_setup):
+def test_post_question_on_unexpected_payload(client):
     """Check the REST API /v1/query with POST HTTP method when unexpected payload is posted."""
-    response = pytest.client.post("/v1/query", json="this is really not proper payload")
-    assert response.status_code == requests.codes.unprocessable
+    response = client.post("/v1/query", json="this is really not proper payload")
+    assert response.status_code == 422
 
     # try to deserialize payload
     response_json = response.json()
@@ -58,11 +61,11 @@ def test_post_question_on_unexpected_payload(_setup):
     }
 
 
-def test_post_question_without_payload(_setup):
+def test_post_question_without_payload(client):
     """Check the REST API /v1/query with POST HTTP method when no payload is posted."""
     # perform POST request without any payload
-    response = pytest.client.post("/v1/query")
-    assert response.status_code == requests.codes.unprocessable
+    response = client.post("/v1/query")
+    assert response.status_code == 422
 
     # check the response payload
     json = response.json()
@@ -72,88 +75,89 @@ def test_post_question_without_payload(_setup):
     assert "Field required" in detail["msg"]
 
 
-def test_post_question_on_invalid_question(_setup):
+def test_post_question_on_invalid_question(client, monkeypatch):
     """Check the REST API /v1/query with POST HTTP method for invalid question."""
     # let's pretend the question is invalid without even asking LLM
-    with patch("ols.app.endpoints.ols.validate_question", return_value=False):
-        conversation_id = suid.get_suid()
-        response = pytest.client.post(
-            "/v1/query",
-            json={"conversation_id": conversation_id, "query": "test query"},
-        )
-        assert response.status_code == requests.codes.ok
+    monkeypatch.setattr("ols.app.endpoints.ols.validate_question", lambda *_: False)
+    conversation_id = suid.get_suid()
+    response = client.post(
+        "/v1/query",
+        json={"conversation_id": conversation_id, "query": "test query"},
+    )
+    assert response.status_code == 200
 
-        expected_json = {
-            "conversation_id": conversation_id,
-            "response": prompts.INVALID_QUERY_RESP,
-            "referenced_documents": [],
-            "truncated": False,
-        }
-        assert response.json() == expected_json
+    expected_json = {
+        "conversation_id": conversation_id,
+        "response": prompts.INVALID_QUERY_RESP,
+        "referenced_documents": [],
+        "truncated": False,
+    }
+    assert response.json() == expected_json
 
 
-def test_post_question_on_generic_response_type_summarize_error(_setup):
+def test_post_question_on_generic_response_type_summarize_error(client, monkeypatch):
     """Check the REST API /v1/query with POST HTTP method when generic response type is returned."""
     # let's pretend the question is valid and generic one
     answer = constants.SUBJECT_ALLOWED
-    with (
-        patch(
-            "ols.app.endpoints.ols.QuestionValidator.validate_question",
-            return_value=answer,
-        ),
-        patch(
-            "ols.app.endpoints.ols.DocsSummarizer.summarize",
-            side_effect=Exception("summarizer error"),
-        ),
-    ):
-        conversation_id = suid.get_suid()
-        response = pytest.client.post(
-            "/v1/query",
-            json={"conversation_id": conversation_id, "query": "test query"},
-        )
-        assert response.status_code == DEFAULT_STATUS_CODE
-        expected_json = {
-            "detail": {
-                "response": DEFAULT_ERROR_MESSAGE,
-                "cause": "summarizer error",
-            }
+
+    def summarize(*_, **__):
+        raise Exception("summarizer error")
+
+    monkeypatch.setattr(
+        "ols.app.endpoints.ols.QuestionValidator.validate_question", lambda *_: answer
+    )
+    monkeypatch.setattr("ols.app.endpoints.ols.DocsSummarizer.summarize", summarize)
+    conversation_id = suid.get_suid()
+    response = client.post(
+        "/v1/query",
+        json={"conversation_id": conversation_id, "query": "test query"},
+    )
+    assert response.status_code == DEFAULT_STATUS_CODE
+    expected_json = {
+        "detail": {
+            "response": DEFAULT_ERROR_MESSAGE,
+            "cause": "summarizer error",
         }
+    }
 
-        assert response.json() == expected_json
+    assert response.json() == expected_json
 
 
 @patch(
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-def test_post_question_that_is_not_validated(_setup):
+def test_post_question_that_is_not_validated(client, monkeypatch):
     """Check the REST API /v1/query with POST HTTP method for question that is not validated."""
+
+    def validate_question(*_):
+        raise Exception("can not validate")
+
     # let's pretend the question can not be validated
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question",
-        side_effect=Exception("can not validate"),
-    ):
-        conversation_id = suid.get_suid()
-        response = pytest.client.post(
-            "/v1/query",
-            json={"conversation_id": conversation_id, "query": "test query"},
-        )
+    monkeypatch.setattr(
+        "ols.app.endpoints.ols.QuestionValidator.validate_question", validate_question
+    )
+    conversation_id = suid.get_suid()
+    response = client.post(
+        "/v1/query",
+        json={"conversation_id": conversation_id, "query": "test query"},
+    )
 
-        # error should be returned
-        assert response.status_code == requests.codes.internal_server_error
-        expected_details = {
-            "detail": {
-                "cause": "can not validate",
-                "response": "Error while validating question",
-            }
+    # error should be returned
+    assert response.status_code == 500
+    expected_details = {
+        "detail": {
+            "cause": "can not validate",
+            "response": "Error while validating question",
         }
-        assert response.json() == expected_details
+    }
+    assert response.json() == expected_details
 
 
-def test_post_question_with_provider_but_not_model(_setup):
+def test_post_question_with_provider_but_not_model(client):
     """Check how missing model is detected in request."""
     conversation_id = suid.get_suid()
-    response = pytest.client.post(
+    response = client.post(
         "/v1/query",
         json={
             "conversation_id": conversation_id,
@@ -161,7 +165,7 @@ def test_post_question_with_provider_but_not_model(_setup):
             "provider": constants.PROVIDER_BAM,
         },
     )
-    assert response.status_code == requests.codes.unprocessable
+    assert response.status_code == 422
     assert len(response.json()["detail"]) == 1
     assert response.json()["detail"][0]["type"] == "value_error"
     assert (
@@ -170,10 +174,10 @@ def test_post_question_with_provider_but_not_model(_setup):
     )
 
 
-def test_post_question_with_model_but_not_provider(_setup):
+def test_post_question_with_model_but_not_provider(client):
     """Check how missing provider is detected in request."""
     conversation_id = suid.get_suid()
-    response = pytest.client.post(
+    response = client.post(
         "/v1/query",
         json={
             "conversation_id": conversation_id,
@@ -181,7 +185,7 @@ def test_post_question_with_model_but_not_provider(_setup):
             "model": constants.GRANITE_13B_CHAT_V2,
         },
     )
-    assert response.status_code == requests.codes.unprocessable
+    assert response.status_code == 422
     assert len(response.json()["detail"]) == 1
     assert response.json()["detail"][0]["type"] == "value_error"
     assert (
@@ -190,11 +194,11 @@ def test_post_question_with_model_but_not_provider(_setup):
     )
 
 
-def test_unknown_provider_in_post(_setup):
+def test_unknown_provider_in_post(client):
     """Check the REST API /v1/query with POST method when unknown provider is requested."""
     # empty config - no providers
     config.llm_config.providers = {}
-    response = pytest.client.post(
+    response = client.post(
         "/v1/query",
         json={
             "query": "hello?",
@@ -203,7 +207,7 @@ def test_unknown_provider_in_post(_setup):
         },
     )
 
-    assert response.status_code == requests.codes.unprocessable
+    assert response.status_code == 422
     expected_json = {
         "detail": {
             "cause": "Provider 'some-provider' is not a valid provider. "
@@ -219,14 +223,14 @@ def test_unknown_provider_in_post(_setup):
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-def test_unsupported_model_in_post(_setup):
+def test_unsupported_model_in_post(client):
     """Check the REST API /v1/query with POST method when unsupported model is requested."""
     test_provider = "test-provider"
     provider_config = ProviderConfig()
     provider_config.models = {}  # no models configured
     config.llm_config.providers = {test_provider: provider_config}
 
-    response = pytest.client.post(
+    response = client.post(
         "/v1/query",
         json={
             "query": "hello?",
@@ -235,7 +239,7 @@ def test_unsupported_model_in_post(_setup):
         },
     )
 
-    assert response.status_code == requests.codes.unprocessable
+    assert response.status_code == 422
     expected_json = {
         "detail": {
             "cause": "Model 'some-model' is not a valid model for "
@@ -246,61 +250,50 @@ def test_unsupported_model_in_post(_setup):
     assert response.json() == expected_json
 
 
-def test_post_question_improper_conversation_id(_setup) -> None:
+def test_post_question_improper_conversation_id(client, monkeypatch) -> None:
     """Check the REST API /v1/query with POST HTTP method with improper conversation ID."""
     assert config.dev_config is not None
     config.dev_config.disable_auth = True
     answer = constants.SUBJECT_ALLOWED
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question", return_value=answer
-    ):
-
-        conversation_id = "not-correct-uuid"
-        response = pytest.client.post(
-            "/v1/query",
-            json={
-                "conversation_id": conversation_id,
-                "query": "test query",
-            },
-        )
-        # error should be returned
-        assert response.status_code == requests.codes.internal_server_error
-        expected_details = {
-            "detail": {
-                "cause": "Invalid conversation ID not-correct-uuid",
-                "response": "Error retrieving conversation history",
-            }
+    monkeypatch.setattr(
+        "ols.app.endpoints.ols.QuestionValidator.validate_question", lambda *_: answer
+    )
+    conversation_id = "not-correct-uuid"
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query",
+        },
+    )
+    # error should be returned
+    assert response.status_code == 500
+    expected_details = {
+        "detail": {
+            "cause": "Invalid conversation ID not-correct-uuid",
+            "response": "Error retrieving conversation history",
         }
-        assert response.json() == expected_details
+    }
+    assert response.json() == expected_details
 
 
-def test_post_question_on_noyaml_response_type(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_question_on_noyaml_response_type(client, monkeypatch) -> None:
     """Check the REST API /v1/query with POST HTTP method when call is success."""
     answer = constants.SUBJECT_ALLOWED
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question", return_value=answer
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "test query",
-                },
-            )
-            print(response)
-            assert response.status_code == requests.codes.ok
+    monkeypatch.setattr(
+        "ols.app.endpoints.ols.QuestionValidator.validate_question", lambda *_: answer
+    )
+    conversation_id = suid.get_suid()
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query",
+        },
+    )
+    print(response)
+    assert response.status_code == 200
 
 
 @patch(
@@ -308,33 +301,30 @@ def test_post_question_on_noyaml_response_type(_setup) -> None:
     constants.QueryValidationMethod.KEYWORD,
 )
 @patch("ols.app.endpoints.ols.QuestionValidator.validate_question")
-def test_post_question_with_keyword(mock_llm_validation, _setup) -> None:
+def test_post_question_with_keyword(mock_llm_validation, client, monkeypatch) -> None:
     """Check the REST API /v1/query with keyword validation."""
     query = "What is Openshift ?"
 
     ml = mock_langchain_interface(None)
-    with (
-        patch(
-            "ols.src.query_helpers.docs_summarizer.LLMChain",
-            new=mock_llm_chain(None),
-        ),
-        patch(
-            "ols.src.query_helpers.query_helper.load_llm",
-            new=mock_llm_loader(ml()),
-        ),
-    ):
-        conversation_id = suid.get_suid()
-        response = pytest.client.post(
-            "/v1/query",
-            json={"conversation_id": conversation_id, "query": query},
-        )
-        assert response.status_code == requests.codes.ok
-        # Currently mock invoke passes same query as response text.
-        assert query in response.json()["response"]
-        assert mock_llm_validation.call_count == 0
+    monkeypatch.setattr(
+        "ols.src.query_helpers.docs_summarizer.LLMChain", mock_llm_chain(None)
+    )
+    monkeypatch.setattr(
+        "ols.src.query_helpers.query_helper.load_llm", mock_llm_loader(ml())
+    )
+    conversation_id = suid.get_suid()
+    response = client.post(
+        "/v1/query",
+        json={"conversation_id": conversation_id, "query": query},
+    )
+    assert response.status_code == 200
+    # Currently mock invoke passes same query as response text.
+    assert query in response.json()["response"]
+    assert mock_llm_validation.call_count == 0
 
 
-def test_post_query_with_query_filters_response_type(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_query_with_query_filters_response_type(client, monkeypatch) -> None:
     """Check the REST API /v1/query with POST HTTP method with query filters."""
     answer = constants.SUBJECT_ALLOWED
 
@@ -349,138 +339,95 @@ def test_post_query_with_query_filters_response_type(_setup) -> None:
     ]
     config.ols_config.query_filters = query_filters
 
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question", return_value=answer
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "test query with 9.25.33.67 will be replaced with redacted_ip",
-                },
-            )
-            print(response.json())
-            assert response.status_code == requests.codes.ok
-            assert (
-                "test query with redacted_ip will be replaced with redacted_ip"
-                in response.json()["response"]
-            )
+    monkeypatch.setattr(
+        "ols.app.endpoints.ols.QuestionValidator.validate_question", lambda *_: answer
+    )
+    conversation_id = suid.get_suid()
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query with 9.25.33.67 will be replaced with redacted_ip",
+        },
+    )
+    print(response.json())
+    assert response.status_code == 200
+    assert (
+        "test query with redacted_ip will be replaced with redacted_ip"
+        in response.json()["response"]
+    )
 
 
-def test_post_query_for_conversation_history(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_query_for_conversation_history(client, monkeypatch) -> None:
     """Check the REST API /v1/query with same conversation_id for conversation history."""
     answer = constants.SUBJECT_ALLOWED
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question", return_value=answer
+    monkeypatch.setattr(
+        "ols.app.endpoints.ols.QuestionValidator.validate_question", lambda *_: answer
+    )
+    with (
+        patch(
+            "ols.src.query_helpers.docs_summarizer.LLMChain.invoke",
+            return_value={"text": "some response"},
+        ) as invoke,
+        patch(
+            "ols.app.metrics.token_counter.TokenMetricUpdater.__enter__",
+        ) as token_counter,
     ):
+        conversation_id = suid.get_suid()
+        response = client.post(
+            "/v1/query",
+            json={
+                "conversation_id": conversation_id,
+                "query": "Query1",
+            },
+        )
+        assert response.status_code == 200
+        invoke.assert_called_once_with(
+            input={
+                "query": "Query1",
+            },
+            config={"callbacks": [token_counter.return_value]},
+        )
+        invoke.reset_mock()
 
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain.invoke",
-                return_value={"text": "some response"},
-            ) as invoke,
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-            patch(
-                "ols.app.metrics.token_counter.TokenMetricUpdater.__enter__",
-            ) as token_counter,
-        ):
-            conversation_id = suid.get_suid()
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "Query1",
-                },
-            )
-            assert response.status_code == requests.codes.ok
-            invoke.assert_called_once_with(
-                input={
-                    "query": "Query1",
-                },
-                config={"callbacks": [token_counter.return_value]},
-            )
-            invoke.reset_mock()
-
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "Query2",
-                },
-            )
-            chat_history_expected = [
-                HumanMessage(content="Query1"),
-                AIMessage(content=response.json()["response"]),
-            ]
-            invoke.assert_called_once_with(
-                input={
-                    "query": "Query2",
-                    "chat_history": chat_history_expected,
-                },
-                config={"callbacks": [token_counter.return_value]},
-            )
+        response = client.post(
+            "/v1/query",
+            json={
+                "conversation_id": conversation_id,
+                "query": "Query2",
+            },
+        )
+        chat_history_expected = [
+            HumanMessage(content="Query1"),
+            AIMessage(content=response.json()["response"]),
+        ]
+        invoke.assert_called_once_with(
+            input={
+                "query": "Query2",
+                "chat_history": chat_history_expected,
+            },
+            config={"callbacks": [token_counter.return_value]},
+        )
 
 
 @patch(
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-def test_post_question_without_attachments(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_question_without_attachments(client, mock_validate_question) -> None:
     """Check the REST API /v1/query with POST HTTP method without attachments."""
-    answer = constants.SUBJECT_ALLOWED
-    query_passed = None
-
-    def validate_question(_conversation_id, query):
-        """Closure called indirectly to validate the question."""
-        nonlocal query_passed
-        query_passed = query
-        return answer
-
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question",
-        side_effect=validate_question,
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "test query",
-                },
-            )
-            assert response.status_code == requests.codes.ok
-    assert query_passed == "test query"
+    conversation_id = suid.get_suid()
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query",
+        },
+    )
+    assert response.status_code == 200
+    mock_validate_question.assert_called_once_with(conversation_id, "test query")
 
 
 @patch(
@@ -488,43 +435,22 @@ def test_post_question_without_attachments(_setup) -> None:
     constants.QueryValidationMethod.LLM,
 )
 @pytest.mark.attachment
-def test_post_question_with_empty_list_of_attachments(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_question_with_empty_list_of_attachments(
+    client, mock_validate_question
+) -> None:
     """Check the REST API /v1/query with POST HTTP method with empty list of attachments."""
-    answer = constants.SUBJECT_ALLOWED
-    query_passed = None
-
-    def validate_question(_conversation_id, query):
-        """Closure called indirectly to validate the question."""
-        nonlocal query_passed
-        query_passed = query
-        return answer
-
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question",
-        side_effect=validate_question,
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "test query",
-                    "attachments": [],
-                },
-            )
-            assert response.status_code == requests.codes.ok
-    assert query_passed == "test query"
+    conversation_id = suid.get_suid()
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query",
+            "attachments": [],
+        },
+    )
+    assert response.status_code == 200
+    mock_validate_question.assert_called_once_with(conversation_id, "test query")
 
 
 @pytest.mark.attachment
@@ -532,48 +458,27 @@ def test_post_question_with_empty_list_of_attachments(_setup) -> None:
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-def test_post_question_with_one_plaintext_attachment(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_question_with_one_plaintext_attachment(
+    client, mock_validate_question
+) -> None:
     """Check the REST API /v1/query with POST HTTP method with one attachment."""
-    answer = constants.SUBJECT_ALLOWED
-    query_passed = None
-
-    def validate_question(_conversation_id, query):
-        """Closure called indirectly to validate the question."""
-        nonlocal query_passed
-        query_passed = query
-        return answer
-
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question",
-        side_effect=validate_question,
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "test query",
-                    "attachments": [
-                        {
-                            "attachment_type": "log",
-                            "content": "this is attachment",
-                            "content_type": "text/plain",
-                        },
-                    ],
+    conversation_id = suid.get_suid()
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query",
+            "attachments": [
+                {
+                    "attachment_type": "log",
+                    "content": "this is attachment",
+                    "content_type": "text/plain",
                 },
-            )
-            assert response.status_code == requests.codes.ok
+            ],
+        },
+    )
+    assert response.status_code == 200
     expected = """test query
 
 
@@ -581,7 +486,7 @@ def test_post_question_with_one_plaintext_attachment(_setup) -> None:
 this is attachment
 ```
 """
-    assert query_passed == expected
+    mock_validate_question.assert_called_once_with(conversation_id, expected)
 
 
 @pytest.mark.attachment
@@ -589,53 +494,30 @@ this is attachment
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-def test_post_question_with_one_yaml_attachment(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_question_with_one_yaml_attachment(client, mock_validate_question) -> None:
     """Check the REST API /v1/query with POST HTTP method with YAML attachment."""
-    answer = constants.SUBJECT_ALLOWED
-    query_passed = None
-
-    def validate_question(_conversation_id, query):
-        """Closure called indirectly to validate the question."""
-        nonlocal query_passed
-        query_passed = query
-        return answer
-
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question",
-        side_effect=validate_question,
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-            yaml = """
+    conversation_id = suid.get_suid()
+    yaml = """
 kind: Pod
 metadata:
      name: private-reg
 """
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "test query",
-                    "attachments": [
-                        {
-                            "attachment_type": "configuration",
-                            "content": yaml,
-                            "content_type": "application/yaml",
-                        },
-                    ],
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query",
+            "attachments": [
+                {
+                    "attachment_type": "configuration",
+                    "content": yaml,
+                    "content_type": "application/yaml",
                 },
-            )
-            assert response.status_code == requests.codes.ok
+            ],
+        },
+    )
+    assert response.status_code == 200
     expected = """test query
 
 For reference, here is the full resource YAML for Pod 'private-reg':
@@ -647,7 +529,7 @@ metadata:
 
 ```
 """
-    assert query_passed == expected
+    mock_validate_question.assert_called_once_with(conversation_id, expected)
 
 
 @pytest.mark.attachment
@@ -655,63 +537,42 @@ metadata:
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-def test_post_question_with_two_yaml_attachments(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_question_with_two_yaml_attachments(
+    client, mock_validate_question
+) -> None:
     """Check the REST API /v1/query with POST HTTP method with two YAML attachments."""
-    answer = constants.SUBJECT_ALLOWED
-    query_passed = None
-
-    def validate_question(_conversation_id, query):
-        """Closure called indirectly to validate the question."""
-        nonlocal query_passed
-        query_passed = query
-        return answer
-
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question",
-        side_effect=validate_question,
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-            yaml1 = """
+    conversation_id = suid.get_suid()
+    yaml1 = """
 kind: Pod
 metadata:
      name: private-reg
 """
-            yaml2 = """
+    yaml2 = """
 kind: Deployment
 metadata:
      name: foobar-deployment
 """
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "test query",
-                    "attachments": [
-                        {
-                            "attachment_type": "configuration",
-                            "content": yaml1,
-                            "content_type": "application/yaml",
-                        },
-                        {
-                            "attachment_type": "configuration",
-                            "content": yaml2,
-                            "content_type": "application/yaml",
-                        },
-                    ],
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query",
+            "attachments": [
+                {
+                    "attachment_type": "configuration",
+                    "content": yaml1,
+                    "content_type": "application/yaml",
                 },
-            )
-            assert response.status_code == requests.codes.ok
+                {
+                    "attachment_type": "configuration",
+                    "content": yaml2,
+                    "content_type": "application/yaml",
+                },
+            ],
+        },
+    )
+    assert response.status_code == 200
     expected = """test query
 
 For reference, here is the full resource YAML for Pod 'private-reg':
@@ -733,7 +594,7 @@ metadata:
 
 ```
 """
-    assert query_passed == expected
+    mock_validate_question.assert_called_once_with(conversation_id, expected)
 
 
 @pytest.mark.attachment
@@ -741,52 +602,31 @@ metadata:
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-def test_post_question_with_one_yaml_without_kind_attachment(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_question_with_one_yaml_without_kind_attachment(
+    client, mock_validate_question
+) -> None:
     """Check the REST API /v1/query with POST HTTP method with one YAML without kind attachment."""
-    answer = constants.SUBJECT_ALLOWED
-    query_passed = None
-
-    def validate_question(_conversation_id, query):
-        """Closure called indirectly to validate the question."""
-        nonlocal query_passed
-        query_passed = query
-        return answer
-
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question",
-        side_effect=validate_question,
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-            yaml = """
+    conversation_id = suid.get_suid()
+    yaml = """
 metadata:
      name: private-reg
 """
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "test query",
-                    "attachments": [
-                        {
-                            "attachment_type": "configuration",
-                            "content": yaml,
-                            "content_type": "application/yaml",
-                        },
-                    ],
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query",
+            "attachments": [
+                {
+                    "attachment_type": "configuration",
+                    "content": yaml,
+                    "content_type": "application/yaml",
                 },
-            )
-            assert response.status_code == requests.codes.ok
+            ],
+        },
+    )
+    assert response.status_code == 200
     expected = """test query
 
 For reference, here is the full resource YAML:
@@ -797,7 +637,7 @@ metadata:
 
 ```
 """
-    assert query_passed == expected
+    mock_validate_question.assert_called_once_with(conversation_id, expected)
 
 
 @pytest.mark.attachment
@@ -805,53 +645,32 @@ metadata:
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-def test_post_question_with_one_yaml_without_name_attachment(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_question_with_one_yaml_without_name_attachment(
+    client, mock_validate_question
+) -> None:
     """Check the REST API /v1/query with POST HTTP method with one YAML without name attachment."""
-    answer = constants.SUBJECT_ALLOWED
-    query_passed = None
-
-    def validate_question(_conversation_id, query):
-        """Closure called indirectly to validate the question."""
-        nonlocal query_passed
-        query_passed = query
-        return answer
-
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question",
-        side_effect=validate_question,
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-            yaml = """
+    conversation_id = suid.get_suid()
+    yaml = """
 kind: Deployment
 metadata:
      foo: bar
 """
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "test query",
-                    "attachments": [
-                        {
-                            "attachment_type": "configuration",
-                            "content": yaml,
-                            "content_type": "application/yaml",
-                        },
-                    ],
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query",
+            "attachments": [
+                {
+                    "attachment_type": "configuration",
+                    "content": yaml,
+                    "content_type": "application/yaml",
                 },
-            )
-            assert response.status_code == requests.codes.ok
+            ],
+        },
+    )
+    assert response.status_code == 200
     expected = """test query
 
 For reference, here is the full resource YAML:
@@ -863,7 +682,7 @@ metadata:
 
 ```
 """
-    assert query_passed == expected
+    mock_validate_question.assert_called_once_with(conversation_id, expected)
 
 
 @pytest.mark.attachment
@@ -871,53 +690,32 @@ metadata:
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-def test_post_question_with_one_invalid_yaml_attachment(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_question_with_one_invalid_yaml_attachment(
+    client, mock_validate_question
+) -> None:
     """Check the REST API /v1/query with POST HTTP method with one invalid YAML attachment."""
-    answer = constants.SUBJECT_ALLOWED
-    query_passed = None
-
-    def validate_question(_conversation_id, query):
-        """Closure called indirectly to validate the question."""
-        nonlocal query_passed
-        query_passed = query
-        return answer
-
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question",
-        side_effect=validate_question,
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-            yaml = """
+    conversation_id = suid.get_suid()
+    yaml = """
 kind: Pod
 *metadata:
      name: private-reg
 """
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "test query",
-                    "attachments": [
-                        {
-                            "attachment_type": "configuration",
-                            "content": yaml,
-                            "content_type": "application/yaml",
-                        },
-                    ],
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query",
+            "attachments": [
+                {
+                    "attachment_type": "configuration",
+                    "content": yaml,
+                    "content_type": "application/yaml",
                 },
-            )
-            assert response.status_code == requests.codes.ok
+            ],
+        },
+    )
+    assert response.status_code == 200
     expected = """test query
 
 For reference, here is the full resource YAML:
@@ -929,18 +727,13 @@ kind: Pod
 
 ```
 """
-    assert query_passed == expected
+    mock_validate_question.assert_called_once_with(conversation_id, expected)
 
 
 @pytest.mark.attachment
-def test_post_question_with_large_attachment(_setup) -> None:
+@pytest.mark.usefixtures("_patched_llm", "mock_validate_question")
+def test_post_question_with_large_attachment(client) -> None:
     """Check the REST API /v1/query with POST HTTP method with large attachment."""
-    answer = constants.SUBJECT_ALLOWED
-
-    def validate_question(_conversation_id, _query):
-        """Closure called indirectly to validate the question."""
-        return answer
-
     # generate large YAML content that exceeds token limit
     yaml = """
 kind: Pod
@@ -951,58 +744,45 @@ logs:
     for i in range(10000):
         yaml += f"    log{i}: 'this is log message #{i}"
 
-    with patch(
-        "ols.app.endpoints.ols.QuestionValidator.validate_question",
-        side_effect=validate_question,
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": "test query",
-                    "attachments": [
-                        {
-                            "attachment_type": "configuration",
-                            "content": yaml,
-                            "content_type": "application/yaml",
-                        },
-                    ],
+    conversation_id = suid.get_suid()
+
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": "test query",
+            "attachments": [
+                {
+                    "attachment_type": "configuration",
+                    "content": yaml,
+                    "content_type": "application/yaml",
                 },
-            )
-            # error should be returned because of very large input
-            assert response.status_code == requests.codes.request_entity_too_large
+            ],
+        },
+    )
+    # error should be returned because of very large input
+    assert response.status_code == 413
 
 
-def test_post_too_long_query(_setup):
+def test_post_too_long_query(client):
     """Check the REST API /v1/query with POST HTTP method for query that is too long."""
     query = "test query" * 1000
     conversation_id = suid.get_suid()
-    response = pytest.client.post(
+    response = client.post(
         "/v1/query",
         json={"conversation_id": conversation_id, "query": query},
     )
 
     # error should be returned
-    assert response.status_code == requests.codes.request_entity_too_large
+    assert response.status_code == 413
     error_response = response.json()["detail"]
     assert error_response["response"] == "Prompt is too long"
     assert "exceeds" in error_response["cause"]
 
 
-def _post_with_system_prompt_override(_setup, caplog, query, system_prompt):
+def _post_with_system_prompt_override(
+    client, monkeypatch, caplog, query, system_prompt
+):
     """Invoke the POST /v1/query API with a system prompt override."""
     logging_config = LoggingConfig(app_log_level="debug")
 
@@ -1010,35 +790,24 @@ def _post_with_system_prompt_override(_setup, caplog, query, system_prompt):
     logger = logging.getLogger("ols")
     logger.handlers = [caplog.handler]  # add caplog handler to logger
 
-    with patch(
+    monkeypatch.setattr(
         "ols.app.endpoints.ols.QuestionValidator.validate_question",
-        side_effect=lambda x, y: constants.SUBJECT_ALLOWED,
-    ):
-        ml = mock_langchain_interface("test response")
-        with (
-            patch(
-                "ols.src.query_helpers.docs_summarizer.LLMChain",
-                new=mock_llm_chain(None),
-            ),
-            patch(
-                "ols.src.query_helpers.query_helper.load_llm",
-                new=mock_llm_loader(ml()),
-            ),
-        ):
-            conversation_id = suid.get_suid()
-            response = pytest.client.post(
-                "/v1/query",
-                json={
-                    "conversation_id": conversation_id,
-                    "query": query,
-                    "system_prompt": system_prompt,
-                },
-            )
-            assert response.status_code == requests.codes.ok
+        lambda *_: constants.SUBJECT_ALLOWED,
+    )
+    conversation_id = suid.get_suid()
+    response = client.post(
+        "/v1/query",
+        json={
+            "conversation_id": conversation_id,
+            "query": query,
+            "system_prompt": system_prompt,
+        },
+    )
+    assert response.status_code == 200
 
     # Specified system prompt should appear twice in query_helper outputs:
     # One is from question_validator and another from docs_summarizer.
-    assert response.status_code == requests.codes.ok
+    assert response.status_code == 200
 
 
 @patch(
@@ -1049,12 +818,13 @@ def _post_with_system_prompt_override(_setup, caplog, query, system_prompt):
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-def test_post_with_system_prompt_override(_setup, caplog):
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_with_system_prompt_override(client, monkeypatch, caplog):
     """Check the POST /v1/query API with a system prompt."""
     query = "test query"
     system_prompt = "You are an expert in something marvelous."
 
-    _post_with_system_prompt_override(_setup, caplog, query, system_prompt)
+    _post_with_system_prompt_override(client, monkeypatch, caplog, query, system_prompt)
 
     # Specified system prompt should appear twice in query_helper debug log outputs.
     # One is from question_validator and another is from docs_summarizer.
@@ -1069,12 +839,13 @@ def test_post_with_system_prompt_override(_setup, caplog):
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-def test_post_with_system_prompt_override_disabled(_setup, caplog):
+@pytest.mark.usefixtures("_patched_llm")
+def test_post_with_system_prompt_override_disabled(client, monkeypatch, caplog):
     """Check the POST /v1/query API with a system prompt when overriding is disabled."""
     query = "test query"
     system_prompt = "You are an expert in something marvelous."
 
-    _post_with_system_prompt_override(_setup, caplog, query, system_prompt)
+    _post_with_system_prompt_override(client, monkeypatch, caplog, query, system_prompt)
 
     # Specified system prompt should NOT appear in query_helper debug log outputs
     # as enable_system_prompt_override is set to False.
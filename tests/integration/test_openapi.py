@@ -1,40 +1,19 @@
 """Integration tests for REST API endpoint that provides OpenAPI specification."""
 
 import json
-import os
-from unittest.mock import patch
 
 import pytest
-import requests
-from fastapi.testclient import TestClient
 
-from ols import config
-from ols.constants import CONFIGURATION_FILE_NAME_ENV_VARIABLE
 
-
-# we need to patch the config file path to point to the test
-# config file before we import anything from main.py
 @pytest.fixture(scope="function", autouse=True)
-@patch.dict(
-    os.environ,
-    {
-        CONFIGURATION_FILE_NAME_ENV_VARIABLE: "tests/config/config_for_integration_tests.yaml"
-    },
-)
-def _setup():
-    """Setups the test client."""
-    config.reload_from_yaml_file("tests/config/config_for_integration_tests.yaml")
-
-    # app.main need to be imported after the configuration is read
-    from ols.app.main import app  # pylint: disable=C0415
-
-    pytest.client = TestClient(app)
+def _setup(_integration_config):
+    """Setups the configuration, the test client is shared by the whole session."""
 
 
-def test_openapi_endpoint():
+def test_openapi_endpoint(client):
     """Check if REST API provides endpoint with OpenAPI specification."""
-    response = pytest.client.get("/openapi.json")
-    assert response.status_code == requests.codes.ok
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
 
     # this line ensures that response payload contains proper JSON
     payload = response.json()
@@ -57,15 +36,15 @@ def test_openapi_endpoint():
         assert endpoint in paths, f"Endpoint {endpoint} is not described"
 
 
-def test_openapi_content():
+def test_openapi_content(client):
     """Check if the pre-generated OpenAPI schema is up-to date."""
     # retrieve pre-generated OpenAPI schema
     with open("docs/openapi.json", encoding="utf-8") as fin:
         pre_generated_schema = json.load(fin)
 
     # retrieve current OpenAPI schema
-    response = pytest.client.get("/openapi.json")
-    assert response.status_code == requests.codes.ok
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
     current_schema = response.json()
 
     # remove node that is not included in pre-generated OpenAPI schema
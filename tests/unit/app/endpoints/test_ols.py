@@ -1,9 +1,14 @@
 """Unit tests for OLS endpoint."""
 
+import copy
+import itertools
 import json
+import os
 import re
+from datetime import datetime, timezone
 from http import HTTPStatus
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -20,20 +25,132 @@ from ols.app.models.models import (
     SummarizerResponse,
 )
 from ols.customize import prompts
+from ols.src.cache.cache import Cache
 from ols.src.llms.llm_loader import LLMConfigurationError
 from ols.utils import suid
 from ols.utils.errors_parsing import DEFAULT_ERROR_MESSAGE
 from ols.utils.redactor import Redactor, RegexFilter
 from ols.utils.token_handler import PromptTooLongError
 
+# any valid conversation ID can be used in tests checking other arguments
+VALID_CONVERSATION_ID = "11111111-1111-1111-1111-111111111111"
+
+# conversation IDs generated up front; tests only need them to be valid
+CONVERSATION_IDS = itertools.cycle([suid.get_suid() for _ in range(16)])
+
+# already validated attachment, Pydantic does not revalidate model instances
+LOG_ATTACHMENT = Attachment(
+    attachment_type="log", content_type="text/plain", content="this is attachment"
+)
+
+# custom redaction filters, the second one works on output of the first one
+KUBERNETES_FILTER = RegexFilter(
+    pattern=re.compile(r"Kubernetes"),
+    name="kubernetes-filter",
+    replace_with="FooBar",
+)
+FOOBAR_FILTER = RegexFilter(
+    pattern=re.compile(r"FooBar"),
+    name="FooBar-filter",
+    replace_with="Baz",
+)
+
+
+@pytest.fixture(scope="module")
+def _parsed_config():
+    """Parse and validate config for unit tests only once."""
+    config.reload_from_yaml_file("tests/config/test_app_endpoints.yaml")
+    return copy.deepcopy(config.config)
+
 
 @pytest.fixture(scope="function")
-def _load_config():
+def _load_config(_parsed_config):
     """Load config before unit tests."""
-    config.reload_from_yaml_file("tests/config/test_app_endpoints.yaml")
+    config.reload_from_config(copy.deepcopy(_parsed_config))
+
+
+@pytest.fixture(scope="module")
+def llm_request_template():
+    """Request with the query used by most of the tests, validated only once."""
+    return LLMRequest(query="Tell me about Kubernetes")
+
+
+@pytest.fixture
+def make_llm_request(llm_request_template):
+    """Return function to create request with given conversation ID.
+
+    Other already validated fields (query, attachments) can be overridden too.
+    """
+
+    def make(conversation_id=None, **update):
+        return llm_request_template.model_copy(
+            update={"conversation_id": conversation_id, **update}
+        )
+
+    return make
 
 
 @pytest.fixture
+def conversation_id():
+    """Return valid conversation ID from the pregenerated ones."""
+    return next(CONVERSATION_IDS)
+
+
+@pytest.fixture(scope="module")
+def _llm_mocks():
+    """Replace LLM based question validation and summarization once per module."""
+    mocks = SimpleNamespace(validate_question=Mock(), summarize=Mock())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "ols.src.query_helpers.question_validator.QuestionValidator.validate_question",
+            mocks.validate_question,
+        )
+        mp.setattr(
+            "ols.src.query_helpers.docs_summarizer.DocsSummarizer.summarize",
+            mocks.summarize,
+        )
+        yield mocks
+
+
+@pytest.fixture(autouse=True)
+def llm_mocks(_llm_mocks):
+    """Provide mocked question validator and summarizer, reset before every test.
+
+    The mocks stay installed for the whole module, so they are reset even
+    for tests not using them to not leak any configured behaviour.
+    """
+    for mock in vars(_llm_mocks).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _llm_mocks
+
+
+@pytest.fixture(scope="module")
+def _cache_mock():
+    """Conversation cache mock created once per module."""
+    return Mock(spec=Cache)
+
+
+@pytest.fixture
+def conversation_cache(_cache_mock, monkeypatch):
+    """Install mocked conversation cache, reset for each test."""
+    _cache_mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(config, "_conversation_cache", _cache_mock)
+    return _cache_mock
+
+
+@pytest.fixture
+def endpoint_mocks(monkeypatch):
+    """Replace question validation and history retrieval done by the endpoint."""
+    mocks = SimpleNamespace(
+        validate_question=Mock(return_value=True),
+        retrieve_previous_input=Mock(return_value=[]),
+    )
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(ols, name, mock)
+    return mocks
+
+
+@pytest.fixture(scope="module")
 def auth():
     """Tuple containing user ID and user name, mocking auth. output."""
     # we can use any UUID, so let's use randomly generated one
@@ -41,65 +158,56 @@ def auth():
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_retrieve_conversation_new_id():
+def test_retrieve_conversation_new_id(make_llm_request):
     """Check the function to retrieve conversation ID."""
-    llm_request = LLMRequest(query="Tell me about Kubernetes", conversation_id=None)
+    llm_request = make_llm_request()
     new_id = ols.retrieve_conversation_id(llm_request)
     assert suid.check_suid(new_id), "Improper conversation ID generated"
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_retrieve_conversation_id_existing_id():
+def test_retrieve_conversation_id_existing_id(make_llm_request, conversation_id):
     """Check the function to retrieve conversation ID when one already exists."""
-    old_id = suid.get_suid()
-    llm_request = LLMRequest(query="Tell me about Kubernetes", conversation_id=old_id)
+    old_id = conversation_id
+    llm_request = make_llm_request(old_id)
     new_id = ols.retrieve_conversation_id(llm_request)
     assert new_id == old_id, "Old (existing) ID should be retrieved."
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_retrieve_previous_input_no_previous_history():
+def test_retrieve_previous_input_no_previous_history(make_llm_request):
     """Check how function to retrieve previous input handle empty history."""
-    llm_request = LLMRequest(query="Tell me about Kubernetes", conversation_id=None)
+    llm_request = make_llm_request()
     llm_input = ols.retrieve_previous_input(constants.DEFAULT_USER_UID, llm_request)
     assert llm_input == []
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_retrieve_previous_input_empty_user_id():
-    """Check how function to retrieve previous input handle empty user ID."""
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(
-        query="Tell me about Kubernetes", conversation_id=conversation_id
-    )
-    # cache must check if user ID is correct
-    with pytest.raises(HTTPException, match="Invalid user ID"):
-        ols.retrieve_previous_input("", llm_request)
-    with pytest.raises(HTTPException, match="Invalid user ID"):
-        ols.retrieve_previous_input(None, llm_request)
-
-
-@pytest.mark.usefixtures("_load_config")
-def test_retrieve_previous_input_improper_user_id():
-    """Check how function to retrieve previous input handle improper user ID."""
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(
-        query="Tell me about Kubernetes", conversation_id=conversation_id
-    )
+@pytest.mark.parametrize(
+    "user_id, expected_message",
+    (
+        ("", "Invalid user ID"),
+        (None, "Invalid user ID"),
+        ("improper_user_id", "Invalid user ID improper_user_id"),
+    ),
+)
+def test_retrieve_previous_input_improper_user_id(
+    user_id, expected_message, make_llm_request, conversation_id
+):
+    """Check how function to retrieve previous input handle empty or improper user ID."""
+    llm_request = make_llm_request(conversation_id)
     # cache must check if user ID is correct
-    with pytest.raises(HTTPException, match="Invalid user ID improper_user_id"):
-        ols.retrieve_previous_input("improper_user_id", llm_request)
+    with pytest.raises(HTTPException, match=expected_message):
+        ols.retrieve_previous_input(user_id, llm_request)
 
 
 @pytest.mark.usefixtures("_load_config")
-@patch("ols.config.conversation_cache.get")
-def test_retrieve_previous_input_for_previous_history(get):
+def test_retrieve_previous_input_for_previous_history(
+    conversation_cache, conversation_id, make_llm_request
+):
     """Check how function to retrieve previous input handle existing history."""
-    conversation_id = suid.get_suid()
-    get.return_value = "input"
-    llm_request = LLMRequest(
-        query="Tell me about Kubernetes", conversation_id=conversation_id
-    )
+    conversation_cache.get.return_value = "input"
+    llm_request = make_llm_request(conversation_id)
     previous_input = ols.retrieve_previous_input(
         constants.DEFAULT_USER_UID, llm_request
     )
@@ -107,168 +215,112 @@ def test_retrieve_previous_input_for_previous_history(get):
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_retrieve_attachments_on_no_input():
-    """Check the function to retrieve attachments from payload when attachments are not send."""
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(
-        query="Tell me about Kubernetes", conversation_id=conversation_id
-    )
-    attachments = ols.retrieve_attachments(llm_request)
-    # empty list should be returned
-    assert attachments is not None
-    assert len(attachments) == 0
-
-
-@pytest.mark.usefixtures("_load_config")
-def test_retrieve_attachments_on_empty_list():
-    """Check the function to retrieve attachments from payload when list of attachments is empty."""
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(
-        query="Tell me about Kubernetes",
-        conversation_id=conversation_id,
-        attachments=[],
-    )
-    attachments = ols.retrieve_attachments(llm_request)
-    # empty list should be returned
-    assert attachments is not None
-    assert len(attachments) == 0
-
-
-@pytest.mark.usefixtures("_load_config")
-def test_retrieve_attachments_on_proper_input():
+@pytest.mark.parametrize(
+    "request_attachments, expected",
+    (
+        # attachments are not send
+        (None, []),
+        # list of attachments is empty
+        ([], []),
+        ([LOG_ATTACHMENT], [LOG_ATTACHMENT]),
+    ),
+)
+def test_retrieve_attachments(
+    request_attachments, expected, conversation_id, make_llm_request
+):
     """Check the function to retrieve attachments from payload."""
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(
-        query="Tell me about Kubernetes",
-        conversation_id=conversation_id,
-        attachments=[
-            {
-                "attachment_type": "log",
-                "content_type": "text/plain",
-                "content": "this is attachment",
-            },
-        ],
-    )
+    llm_request = make_llm_request(conversation_id, attachments=request_attachments)
     attachments = ols.retrieve_attachments(llm_request)
-    # empty list should be returned
-    assert attachments is not None
-    assert len(attachments) == 1
-
-    expected = Attachment(
-        attachment_type="log", content_type="text/plain", content="this is attachment"
-    )
-    assert attachments[0] == expected
+    assert attachments == expected
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_retrieve_attachments_on_improper_attachment_type():
-    """Check the function to retrieve attachments from payload."""
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(
-        query="Tell me about Kubernetes",
-        conversation_id=conversation_id,
-        attachments=[
+@pytest.mark.parametrize(
+    "attachment, expected_message",
+    (
+        (
             {
                 "attachment_type": "not-correct-one",
                 "content_type": "text/plain",
                 "content": "this is attachment",
             },
-        ],
-    )
-    with pytest.raises(
-        HTTPException, match="Attachment with improper type not-correct-one detected"
-    ):
-        ols.retrieve_attachments(llm_request)
-
-
-@pytest.mark.usefixtures("_load_config")
-def test_retrieve_attachments_on_improper_content_type():
-    """Check the function to retrieve attachments from payload."""
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(
-        query="Tell me about Kubernetes",
-        conversation_id=conversation_id,
-        attachments=[
+            "Attachment with improper type not-correct-one detected",
+        ),
+        (
             {
                 "attachment_type": "log",
                 "content_type": "not/known",
                 "content": "this is attachment",
             },
-        ],
+            "Attachment with improper content type not/known detected",
+        ),
+    ),
+)
+def test_retrieve_attachments_on_improper_input(
+    attachment, expected_message, conversation_id
+):
+    """Check the function to retrieve attachments from payload with improper attachment."""
+    llm_request = LLMRequest(
+        query="Tell me about Kubernetes",
+        conversation_id=conversation_id,
+        attachments=[attachment],
     )
-    with pytest.raises(
-        HTTPException, match="Attachment with improper content type not/known detected"
-    ):
+    with pytest.raises(HTTPException, match=expected_message):
         ols.retrieve_attachments(llm_request)
 
 
 @pytest.mark.usefixtures("_load_config")
-@patch("ols.config.conversation_cache.insert_or_append")
-def test_store_conversation_history(insert_or_append):
-    """Test if operation to store conversation history to cache is called."""
-    conversation_id = suid.get_suid()
-    query = "Tell me about Kubernetes"
-    llm_request = LLMRequest(query=query)
-    response = ""
-
-    ols.store_conversation_history(
-        constants.DEFAULT_USER_UID, conversation_id, llm_request, response, []
-    )
-
-    expected_history = CacheEntry(query="Tell me about Kubernetes")
-    insert_or_append.assert_called_with(
-        constants.DEFAULT_USER_UID, conversation_id, expected_history
-    )
-
-
-@pytest.mark.usefixtures("_load_config")
-@patch("ols.config.conversation_cache.insert_or_append")
-def test_store_conversation_history_some_response(insert_or_append):
+@pytest.mark.parametrize(
+    "user_id, response, expected_history",
+    (
+        (
+            constants.DEFAULT_USER_UID,
+            "",
+            CacheEntry(query="Tell me about Kubernetes"),
+        ),
+        (
+            "1234",
+            "*response*",
+            CacheEntry(query="Tell me about Kubernetes", response="*response*"),
+        ),
+    ),
+)
+def test_store_conversation_history(
+    user_id,
+    response,
+    expected_history,
+    conversation_cache,
+    conversation_id,
+    make_llm_request,
+):
     """Test if operation to store conversation history to cache is called."""
-    user_id = "1234"
-    conversation_id = suid.get_suid()
-    query = "Tell me about Kubernetes"
-    llm_request = LLMRequest(query=query)
-    response = "*response*"
+    llm_request = make_llm_request()
 
     ols.store_conversation_history(user_id, conversation_id, llm_request, response, [])
 
-    expected_history = CacheEntry(
-        query="Tell me about Kubernetes", response="*response*"
+    conversation_cache.insert_or_append.assert_called_with(
+        user_id, conversation_id, expected_history
     )
-    insert_or_append.assert_called_with(user_id, conversation_id, expected_history)
-
-
-@pytest.mark.usefixtures("_load_config")
-def test_store_conversation_history_empty_user_id():
-    """Test if basic input verification is done during history store operation."""
-    user_id = ""
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(query="Tell me about Kubernetes")
-    with pytest.raises(HTTPException, match="Invalid user ID"):
-        ols.store_conversation_history(user_id, conversation_id, llm_request, "", [])
-    with pytest.raises(HTTPException, match="Invalid user ID"):
-        ols.store_conversation_history(user_id, conversation_id, llm_request, None, [])
-
-
-@pytest.mark.usefixtures("_load_config")
-def test_store_conversation_history_improper_user_id():
-    """Test if basic input verification is done during history store operation."""
-    user_id = "::::"
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(query="Tell me about Kubernetes")
-    with pytest.raises(HTTPException, match="Invalid user ID"):
-        ols.store_conversation_history(user_id, conversation_id, llm_request, "", [])
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_store_conversation_history_improper_conversation_id():
+@pytest.mark.parametrize(
+    "user_id, conversation_id, response, expected_message",
+    (
+        ("", VALID_CONVERSATION_ID, "", "Invalid user ID"),
+        ("", VALID_CONVERSATION_ID, None, "Invalid user ID"),
+        ("::::", VALID_CONVERSATION_ID, "", "Invalid user ID"),
+        (constants.DEFAULT_USER_UID, "::::", "", "Invalid conversation ID"),
+    ),
+)
+def test_store_conversation_history_improper_ids(
+    user_id, conversation_id, response, expected_message, make_llm_request
+):
     """Test if basic input verification is done during history store operation."""
-    conversation_id = "::::"
-    llm_request = LLMRequest(query="Tell me about Kubernetes")
-    with pytest.raises(HTTPException, match="Invalid conversation ID"):
+    llm_request = make_llm_request()
+    with pytest.raises(HTTPException, match=expected_message):
         ols.store_conversation_history(
-            constants.DEFAULT_USER_UID, conversation_id, llm_request, "", []
+            user_id, conversation_id, llm_request, response, []
         )
 
 
@@ -277,50 +329,22 @@ def test_store_conversation_history_improper_conversation_id():
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.KEYWORD,
 )
-@patch("ols.src.query_helpers.question_validator.QuestionValidator.validate_question")
-def test_validate_question_valid_kw(llm_validate_question_mock):
-    """Check the behaviour of validate_question function using valid keyword."""
-    conversation_id = suid.get_suid()
-    query = "Tell me about Kubernetes?"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
-    resp = ols.validate_question(conversation_id, llm_request)
-
-    assert resp
-    assert llm_validate_question_mock.call_count == 0
-
-
-@pytest.mark.usefixtures("_load_config")
-@patch(
-    "ols.app.endpoints.ols.config.ols_config.query_validation_method",
-    constants.QueryValidationMethod.LLM,
-)
-@patch(
-    "ols.src.query_helpers.question_validator.QuestionValidator.validate_question",
-    side_effect=PromptTooLongError("Prompt length 10000 exceeds LLM"),
-)
-def test_validate_question_too_long_query(llm_validate_question_mock):
-    """Check the behaviour of validate_question function with too long query."""
-    # This test case is applicable only for LLM based query validation.
-    conversation_id = suid.get_suid()
-    query = "Tell me about Kubernetes?"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
-    # PromptTooLongError should be caught and HTTPException needs to be raised
-    with pytest.raises(HTTPException, match="413: {'response': 'Prompt is too long'"):
-        ols.validate_question(conversation_id, llm_request)
-
-
-@pytest.mark.usefixtures("_load_config")
-@patch(
-    "ols.app.endpoints.ols.config.ols_config.query_validation_method",
-    constants.QueryValidationMethod.KEYWORD,
+@pytest.mark.parametrize(
+    "query, expected",
+    (
+        ("Tell me about Kubernetes?", True),
+        ("What does 42 signify ?", False),
+    ),
 )
-def test_validate_question_invalid_kw():
-    """Check the behaviour of validate_question function using invalid keyword."""
-    conversation_id = suid.get_suid()
-    query = "What does 42 signify ?"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
+def test_validate_question_kw(
+    llm_mocks, query, expected, conversation_id, make_llm_request
+):
+    """Check the behaviour of validate_question function using keywords."""
+    llm_request = make_llm_request(conversation_id, query=query)
     resp = ols.validate_question(conversation_id, llm_request)
-    assert not resp
+
+    assert resp is expected
+    assert llm_mocks.validate_question.call_count == 0
 
 
 @pytest.mark.usefixtures("_load_config")
@@ -328,14 +352,11 @@ def test_validate_question_invalid_kw():
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-@patch("ols.src.query_helpers.question_validator.QuestionValidator.validate_question")
-def test_validate_question_llm(validate_question_mock):
+def test_validate_question_llm(llm_mocks, make_llm_request, conversation_id):
     """Check the behaviour of validate_question function with LLM."""
-    conversation_id = suid.get_suid()
-    query = "Tell me about Kubernetes"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
+    llm_request = make_llm_request(conversation_id)
     ols.validate_question(conversation_id, llm_request)
-    validate_question_mock.assert_called_with(conversation_id, query)
+    llm_mocks.validate_question.assert_called_with(conversation_id, llm_request.query)
 
 
 @pytest.mark.usefixtures("_load_config")
@@ -343,113 +364,113 @@ def test_validate_question_llm(validate_question_mock):
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-@patch("ols.src.query_helpers.question_validator.QuestionValidator.validate_question")
-def test_validate_question_on_configuration_error_llm(validate_question_mock):
-    """Check the behaviour of validate_question function when wrong configuration is detected."""
-    # This test case is applicable only for LLM based query validation.
-    conversation_id = suid.get_suid()
-    query = "Tell me about Kubernetes"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
-    validate_question_mock.side_effect = LLMConfigurationError
-
-    # HTTP exception should be raises
-    with pytest.raises(HTTPException, match="Unable to process this request"):
-        ols.validate_question(conversation_id, llm_request)
-
-
-@pytest.mark.usefixtures("_load_config")
-@patch(
-    "ols.app.endpoints.ols.config.ols_config.query_validation_method",
-    constants.QueryValidationMethod.LLM,
+@pytest.mark.parametrize(
+    "validation_error, expected_message",
+    (
+        # PromptTooLongError should be caught and HTTPException needs to be raised
+        (
+            PromptTooLongError("Prompt length 10000 exceeds LLM"),
+            "413: {'response': 'Prompt is too long'",
+        ),
+        # wrong configuration is detected
+        (LLMConfigurationError, "Unable to process this request"),
+        # any exception except HTTPException can be used there
+        (ValueError, "Error while validating question"),
+    ),
 )
-@patch("ols.src.query_helpers.question_validator.QuestionValidator.validate_question")
-def test_validate_question_on_validation_error(validate_question_mock):
-    """Check the behaviour of validate_question function when query is not validated properly."""
-    conversation_id = suid.get_suid()
-    query = "Tell me about Kubernetes"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
-    validate_question_mock.side_effect = (
-        ValueError  # any exception except HTTPException can be used there
-    )
+def test_validate_question_on_llm_error(
+    llm_mocks,
+    validation_error,
+    expected_message,
+    make_llm_request,
+    conversation_id,
+):
+    """Check the behaviour of validate_question function when LLM validation fails."""
+    # This test case is applicable only for LLM based query validation.
+    llm_request = make_llm_request(conversation_id)
+    llm_mocks.validate_question.side_effect = validation_error
 
     # HTTP exception should be raises
-    with pytest.raises(HTTPException, match="Error while validating question"):
+    with pytest.raises(HTTPException, match=expected_message):
         ols.validate_question(conversation_id, llm_request)
 
 
-@patch("ols.app.endpoints.ols._validate_question_keyword")
-@patch("ols.src.query_helpers.question_validator.QuestionValidator.validate_question")
+@patch.object(ols, "_validate_question_keyword")
 def test_validate_question_disabled(
-    validate_question_llm_mock, validate_question_kw_mock
+    validate_question_kw_mock, llm_mocks, conversation_id, make_llm_request
 ):
     """Check the behaviour of validate_question function when it is disabled."""
     # This is the default behavior; no query validation.
-    conversation_id = suid.get_suid()
     query = "What does 42 signify ?"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
+    llm_request = make_llm_request(conversation_id, query=query)
     resp = ols.validate_question(conversation_id, llm_request)
 
-    assert validate_question_llm_mock.call_count == 0
+    assert llm_mocks.validate_question.call_count == 0
     assert validate_question_kw_mock.call_count == 0
     assert resp
 
 
+@pytest.fixture(scope="module")
+def redactor_with():
+    """Return function to create redactor using given custom filters."""
+
+    def make(*filters):
+        # filters from config would be replaced anyway, so none are compiled
+        redactor = Redactor([])
+        redactor.regex_filters = list(filters)
+        return redactor
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def failing_redactor():
+    """Redactor failing on any input."""
+    return Mock(spec=Redactor, redact=Mock(side_effect=Exception))
+
+
 @pytest.mark.usefixtures("_load_config")
-def test_query_filter_no_redact_filters():
-    """Test the function to redact query when no filters are setup."""
-    conversation_id = suid.get_suid()
-    query = "Tell me about Kubernetes"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
-    result = ols.redact_query(conversation_id, llm_request)
+@pytest.mark.parametrize(
+    "filters, expected",
+    (
+        # no custom filters
+        ((), "Tell me about Kubernetes"),
+        # one custom filter
+        ((KUBERNETES_FILTER,), "Tell me about FooBar"),
+        # two custom filters, applied in order
+        ((KUBERNETES_FILTER, FOOBAR_FILTER), "Tell me about Baz"),
+    ),
+)
+def test_query_filter(
+    filters, expected, conversation_id, make_llm_request, redactor_with
+):
+    """Test the function to redact query with custom filters."""
+    llm_request = make_llm_request(conversation_id)
+    redactor = redactor_with(*filters)
+
+    result = ols.redact_query(conversation_id, llm_request, redactor)
     assert result is not None
-    assert result.query == query
+    assert result.query == expected
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_query_filter_with_one_redact_filter():
-    """Test the function to redact query when filter is setup."""
-    conversation_id = suid.get_suid()
-    query = "Tell me about Kubernetes"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
-
-    # use one custom filter
-    q = Redactor(config.ols_config.query_filters)
-    q.regex_filters = [
-        RegexFilter(
-            pattern=re.compile(r"Kubernetes"),
-            name="kubernetes-filter",
-            replace_with="FooBar",
-        )
-    ]
-    config._query_filters = q
-
+def test_query_filter_no_redact_filters(conversation_id, make_llm_request):
+    """Test the function to redact query when no filters are setup."""
+    llm_request = make_llm_request(conversation_id)
     result = ols.redact_query(conversation_id, llm_request)
     assert result is not None
-    assert result.query == "Tell me about FooBar"
+    assert result.query == "Tell me about Kubernetes"
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_query_filter_with_two_redact_filters():
-    """Test the function to redact query when multiple filters are setup."""
-    conversation_id = suid.get_suid()
-    query = "Tell me about Kubernetes"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
-
-    # use two custom filters
-    q = Redactor(config.ols_config.query_filters)
-    q.regex_filters = [
-        RegexFilter(
-            pattern=re.compile(r"Kubernetes"),
-            name="kubernetes-filter",
-            replace_with="FooBar",
-        ),
-        RegexFilter(
-            pattern=re.compile(r"FooBar"),
-            name="FooBar-filter",
-            replace_with="Baz",
-        ),
-    ]
-    config._query_filters = q
+def test_query_filter_from_config(
+    conversation_id, make_llm_request, redactor_with, monkeypatch
+):
+    """Test the function to redact query with filters from configuration."""
+    llm_request = make_llm_request(conversation_id)
+    monkeypatch.setattr(
+        config, "_query_filters", redactor_with(KUBERNETES_FILTER, FOOBAR_FILTER)
+    )
 
     result = ols.redact_query(conversation_id, llm_request)
     assert result is not None
@@ -457,21 +478,20 @@ def test_query_filter_with_two_redact_filters():
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_query_filter_on_redact_error():
+def test_query_filter_on_redact_error(
+    conversation_id, make_llm_request, failing_redactor
+):
     """Test the function to redact query when redactor raises an error."""
-    conversation_id = suid.get_suid()
-    query = "Tell me about Kubernetes"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
-    with pytest.raises(HTTPException, match="Error while redacting query"):
-        with patch("ols.utils.redactor.Redactor.redact", side_effect=Exception):
-            ols.redact_query(conversation_id, llm_request)
+    llm_request = make_llm_request(conversation_id)
+    with pytest.raises(HTTPException) as excinfo:
+        ols.redact_query(conversation_id, llm_request, failing_redactor)
+    assert excinfo.value.detail["response"] == "Error while redacting query"
 
 
-@pytest.mark.usefixtures("_load_config")
-def test_attachments_redact_on_no_filters_defined():
-    """Test the function to redact attachments when no filters are setup."""
-    conversation_id = suid.get_suid()
-    attachments = [
+@pytest.fixture(scope="module")
+def log_attachments():
+    """Log attachments, the first one contains text to be redacted."""
+    return (
         Attachment(
             attachment_type="log",
             content_type="text/plain",
@@ -482,162 +502,116 @@ def test_attachments_redact_on_no_filters_defined():
             content_type="text/plain",
             content="Log created by OpenShift",
         ),
-    ]
-    # try to redact all attachments
-    redacted = ols.redact_attachments(conversation_id, attachments)
-    assert redacted is not None
-
-    # no filters are set up, so the redacted attachments must
-    # be the same as original ones
-    assert redacted == attachments
+    )
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_attachments_redact_with_one_filter_defined():
-    """Test the function to redact attachments when one filter is setup."""
-    conversation_id = suid.get_suid()
-    attachments = [
-        Attachment(
-            attachment_type="log",
-            content_type="text/plain",
-            content="Log created by Kubernetes",
-        ),
-        Attachment(
-            attachment_type="log",
-            content_type="text/plain",
-            content="Log created by OpenShift",
-        ),
-    ]
-
-    # use two custom filters
-    q = Redactor(config.ols_config.query_filters)
-    q.regex_filters = [
-        RegexFilter(
-            pattern=re.compile(r"Kubernetes"),
-            name="kubernetes-filter",
-            replace_with="FooBar",
-        ),
-    ]
-    config._query_filters = q
+@pytest.mark.parametrize(
+    "filters, expected_content",
+    (
+        # no filters are set up, so the attachment must stay the same
+        ((), "Log created by Kubernetes"),
+        # one filter must be applied
+        ((KUBERNETES_FILTER,), "Log created by FooBar"),
+        # both filters must be applied
+        ((KUBERNETES_FILTER, FOOBAR_FILTER), "Log created by Baz"),
+    ),
+)
+def test_attachments_redact(
+    filters,
+    expected_content,
+    conversation_id,
+    log_attachments,
+    redactor_with,
+):
+    """Test the function to redact attachments with custom filters."""
+    attachments = list(log_attachments)
+    redactor = redactor_with(*filters)
 
     # try to redact all attachments
-    redacted = ols.redact_attachments(conversation_id, attachments)
+    redacted = ols.redact_attachments(conversation_id, attachments, redactor)
     assert redacted is not None
 
-    # one filter must be applied
     assert redacted[0] == Attachment(
         attachment_type="log",
         content_type="text/plain",
-        content="Log created by FooBar",
+        content=expected_content,
     )
     # no filters should be applied
-    assert redacted[1] == Attachment(
-        attachment_type="log",
-        content_type="text/plain",
-        content="Log created by OpenShift",
-    )
+    assert redacted[1] == log_attachments[1]
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_attachments_redact_with_two_filters_defined():
-    """Test the function to redact attachments when two filters are setup."""
-    conversation_id = suid.get_suid()
-    attachments = [
-        Attachment(
-            attachment_type="log",
-            content_type="text/plain",
-            content="Log created by Kubernetes",
-        ),
-        Attachment(
-            attachment_type="log",
-            content_type="text/plain",
-            content="Log created by OpenShift",
-        ),
-    ]
+def test_attachments_redact_on_no_filters_defined(conversation_id, log_attachments):
+    """Test the function to redact attachments when no filters are setup."""
+    attachments = list(log_attachments)
+    # try to redact all attachments
+    redacted = ols.redact_attachments(conversation_id, attachments)
+    assert redacted is not None
+
+    # no filters are set up, so the redacted attachments must
+    # be the same as original ones
+    assert redacted == attachments
 
-    # use two custom filters
-    q = Redactor(config.ols_config.query_filters)
-    q.regex_filters = [
-        RegexFilter(
-            pattern=re.compile(r"Kubernetes"),
-            name="kubernetes-filter",
-            replace_with="FooBar",
-        ),
-        RegexFilter(
-            pattern=re.compile(r"FooBar"),
-            name="FooBar-filter",
-            replace_with="Baz",
-        ),
-    ]
-    config._query_filters = q
+
+@pytest.mark.usefixtures("_load_config")
+def test_attachments_redact_with_filters_from_config(
+    conversation_id, log_attachments, redactor_with, monkeypatch
+):
+    """Test the function to redact attachments with filters from configuration."""
+    attachments = list(log_attachments)
+    monkeypatch.setattr(
+        config, "_query_filters", redactor_with(KUBERNETES_FILTER, FOOBAR_FILTER)
+    )
 
     # try to redact all attachments
     redacted = ols.redact_attachments(conversation_id, attachments)
     assert redacted is not None
 
-    # both filters must be applied
+    # both filters must be applied to the first attachment only
     assert redacted[0] == Attachment(
         attachment_type="log",
         content_type="text/plain",
         content="Log created by Baz",
     )
-    # no filters should be applied
-    assert redacted[1] == Attachment(
-        attachment_type="log",
-        content_type="text/plain",
-        content="Log created by OpenShift",
-    )
+    assert redacted[1] == log_attachments[1]
 
 
 @pytest.mark.usefixtures("_load_config")
-def test_attachments_redact_on_redact_error():
+def test_attachments_redact_on_redact_error(
+    conversation_id, log_attachments, failing_redactor
+):
     """Test the function to redact attachments when redactor raises an error."""
-    conversation_id = suid.get_suid()
-    attachments = [
-        Attachment(
-            attachment_type="log",
-            content_type="text/plain",
-            content="Log created by Kubernetes",
-        ),
-        Attachment(
-            attachment_type="log",
-            content_type="text/plain",
-            content="Log created by OpenShift",
-        ),
-    ]
+    attachments = list(log_attachments)
 
     # try to redact all attachments
-    with pytest.raises(HTTPException, match="Error while redacting attachment"):
-        with patch("ols.utils.redactor.Redactor.redact", side_effect=Exception):
-            ols.redact_attachments(conversation_id, attachments)
+    with pytest.raises(HTTPException) as excinfo:
+        ols.redact_attachments(conversation_id, attachments, failing_redactor)
+    assert excinfo.value.detail["response"] == "Error while redacting attachment"
 
 
-@pytest.mark.usefixtures("_load_config")
+@pytest.mark.usefixtures("_load_config", "conversation_cache")
 @patch(
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-@patch("ols.src.query_helpers.question_validator.QuestionValidator.validate_question")
-@patch("ols.src.query_helpers.docs_summarizer.DocsSummarizer.summarize")
-@patch("ols.config.conversation_cache.get")
 def test_conversation_request(
-    mock_conversation_cache_get,
-    mock_summarize,
-    mock_validate_question,
+    llm_mocks,
     auth,
+    make_llm_request,
 ):
     """Test conversation request API endpoint."""
     # valid question
-    mock_validate_question.return_value = True
+    llm_mocks.validate_question.return_value = True
     mock_response = (
         "Kubernetes is an open-source container-orchestration system..."  # summary
     )
-    mock_summarize.return_value = SummarizerResponse(
+    llm_mocks.summarize.return_value = SummarizerResponse(
         response=mock_response,
         rag_chunks=[],
         history_truncated=False,
     )
-    llm_request = LLMRequest(query="Tell me about Kubernetes")
+    llm_request = make_llm_request()
     response = ols.conversation_request(llm_request, auth)
     assert (
         response.response
@@ -648,7 +622,7 @@ def test_conversation_request(
     ), "Improper conversation ID returned"
 
     # invalid question
-    mock_validate_question.return_value = False
+    llm_mocks.validate_question.return_value = False
     llm_request = LLMRequest(query="Generate a yaml")
     response = ols.conversation_request(llm_request, auth)
     assert response.response == prompts.INVALID_QUERY_RESP
@@ -657,52 +631,44 @@ def test_conversation_request(
     ), "Improper conversation ID returned"
 
     # validation failure
-    mock_validate_question.side_effect = HTTPException
+    llm_mocks.validate_question.side_effect = HTTPException
     with pytest.raises(HTTPException) as excinfo:
-        llm_request = LLMRequest(query="Generate a yaml")
-        response = ols.conversation_request(llm_request, auth)
-        assert excinfo.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
-        assert len(response.conversation_id) == 0
+        ols.conversation_request(llm_request, auth)
+    assert excinfo.value.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
 
 
-@pytest.mark.usefixtures("_load_config")
+@pytest.mark.usefixtures("_load_config", "conversation_cache")
 @patch(
     "ols.app.endpoints.ols.config.ols_config.query_validation_method",
     constants.QueryValidationMethod.LLM,
 )
-@patch("ols.src.query_helpers.question_validator.QuestionValidator.validate_question")
-@patch("ols.config.conversation_cache.get")
-def test_conversation_request_on_wrong_configuration(
-    mock_conversation_cache_get,
-    mock_validate_question,
-    auth,
-):
+def test_conversation_request_on_wrong_configuration(llm_mocks, auth, make_llm_request):
     """Test conversation request API endpoint."""
     # mock invalid configuration
     message = "wrong model is configured"
-    mock_validate_question.side_effect = Mock(
-        side_effect=LLMConfigurationError(message)
-    )
-    llm_request = LLMRequest(query="Tell me about Kubernetes")
+    llm_mocks.validate_question.side_effect = LLMConfigurationError(message)
+    llm_request = make_llm_request()
 
     # call must fail because we mocked invalid configuration state
-    with pytest.raises(HTTPException, match="Unable to process this request"):
+    with pytest.raises(HTTPException) as excinfo:
         ols.conversation_request(llm_request, auth)
+    assert excinfo.value.detail == {
+        "response": "Unable to process this request",
+        "cause": message,
+    }
 
 
 @pytest.mark.usefixtures("_load_config")
-@patch("ols.app.endpoints.ols.retrieve_previous_input", new=Mock(return_value=None))
-@patch(
-    "ols.app.endpoints.ols.validate_question",
-    new=Mock(return_value=False),
-)
-def test_question_validation_in_conversation_start(auth):
+def test_question_validation_in_conversation_start(
+    endpoint_mocks, auth, conversation_id, make_llm_request
+):
     """Test if question validation is skipped in follow-up conversation."""
     # note the `validate_question` is patched to always return as `SUBJECT_REJECTED`
     # this should resolve in rejection in summarization
-    conversation_id = suid.get_suid()
+    endpoint_mocks.retrieve_previous_input.return_value = None
+    endpoint_mocks.validate_question.return_value = False
     query = "some elaborate question"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
+    llm_request = make_llm_request(conversation_id, query=query)
 
     response = ols.conversation_request(llm_request, auth)
 
@@ -710,27 +676,23 @@ def test_question_validation_in_conversation_start(auth):
 
 
 @pytest.mark.usefixtures("_load_config")
-@patch(
-    "ols.app.endpoints.ols.retrieve_previous_input",
-    new=Mock(return_value=[CacheEntry(query="some question")]),
-)
-@patch(
-    "ols.app.endpoints.ols.validate_question",
-    new=Mock(return_value=constants.SUBJECT_REJECTED),
-)
-@patch("ols.src.query_helpers.docs_summarizer.DocsSummarizer.summarize")
-def test_no_question_validation_in_follow_up_conversation(mock_summarize, auth):
+def test_no_question_validation_in_follow_up_conversation(
+    endpoint_mocks, llm_mocks, auth, conversation_id, make_llm_request
+):
     """Test if question validation is skipped in follow-up conversation."""
     # note the `validate_question` is patched to always return as `SUBJECT_REJECTED`
     # but as it is not the first question, it should proceed to summarization
-    mock_summarize.return_value = SummarizerResponse(
+    endpoint_mocks.retrieve_previous_input.return_value = [
+        CacheEntry(query="some question")
+    ]
+    endpoint_mocks.validate_question.return_value = constants.SUBJECT_REJECTED
+    llm_mocks.summarize.return_value = SummarizerResponse(
         "some elaborate answer",
         [],
         False,
     )
-    conversation_id = suid.get_suid()
     query = "some elaborate question"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
+    llm_request = make_llm_request(conversation_id, query=query)
 
     response = ols.conversation_request(llm_request, auth)
 
@@ -738,13 +700,12 @@ def test_no_question_validation_in_follow_up_conversation(mock_summarize, auth):
 
 
 @pytest.mark.usefixtures("_load_config")
-@patch("ols.app.endpoints.ols.validate_question")
-def test_conversation_request_invalid_subject(mock_validate, auth):
+def test_conversation_request_invalid_subject(endpoint_mocks, auth, make_llm_request):
     """Test how generate_response function checks validation results."""
     # prepare arguments for DocsSummarizer
-    llm_request = LLMRequest(query="Tell me about Kubernetes")
+    llm_request = make_llm_request()
 
-    mock_validate.return_value = False
+    endpoint_mocks.validate_question.return_value = False
     response = ols.conversation_request(llm_request, auth)
     assert response.response == prompts.INVALID_QUERY_RESP
     assert len(response.referenced_documents) == 0
@@ -752,22 +713,20 @@ def test_conversation_request_invalid_subject(mock_validate, auth):
 
 
 @pytest.mark.usefixtures("_load_config")
-@patch("ols.src.query_helpers.docs_summarizer.DocsSummarizer.summarize")
-def test_generate_response_valid_subject(mock_summarize):
+def test_generate_response_valid_subject(llm_mocks, make_llm_request, conversation_id):
     """Test how generate_response function checks validation results."""
     # mock the DocsSummarizer
     mock_response = (
         "Kubernetes is an open-source container-orchestration system..."  # summary
     )
-    mock_summarize.return_value = SummarizerResponse(
+    llm_mocks.summarize.return_value = SummarizerResponse(
         mock_response,
         [],
         False,
     )
 
     # prepare arguments for DocsSummarizer
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(query="Tell me about Kubernetes")
+    llm_request = make_llm_request()
     previous_input = []
 
     # try to get response
@@ -782,15 +741,15 @@ def test_generate_response_valid_subject(mock_summarize):
 
 
 @pytest.mark.usefixtures("_load_config")
-@patch("ols.src.query_helpers.docs_summarizer.DocsSummarizer.summarize")
-def test_generate_response_on_summarizer_error(mock_summarize):
+def test_generate_response_on_summarizer_error(
+    llm_mocks, make_llm_request, conversation_id
+):
     """Test how generate_response function checks validation results."""
     # mock the DocsSummarizer
-    mock_summarize.side_effect = Exception  # any exception might occur
+    llm_mocks.summarize.side_effect = Exception  # any exception might occur
 
     # prepare arguments for DocsSummarizer
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(query="Tell me about Kubernetes")
+    llm_request = make_llm_request()
     previous_input = None
 
     # try to get response
@@ -798,15 +757,13 @@ def test_generate_response_on_summarizer_error(mock_summarize):
         ols.generate_response(conversation_id, llm_request, previous_input)
 
 
-@patch(
-    "ols.src.query_helpers.question_validator.QuestionValidator.validate_question",
-    side_effect=Exception("mocked exception"),
-)
-def test_generate_response_unknown_validation_result(exc):
+def test_generate_response_unknown_validation_result(
+    llm_mocks, make_llm_request, conversation_id
+):
     """Test how generate_response function checks validation results."""
+    llm_mocks.validate_question.side_effect = Exception("mocked exception")
     # prepare arguments for DocsSummarizer
-    conversation_id = suid.get_suid()
-    llm_request = LLMRequest(query="Tell me about Kubernetes")
+    llm_request = make_llm_request()
     previous_input = None
 
     # try to get response
@@ -815,41 +772,41 @@ def test_generate_response_unknown_validation_result(exc):
 
 
 @pytest.fixture
-def transcripts_location(tmpdir):
-    """Fixture sets feedback location to tmpdir and return the path."""
+def transcripts_location(tmp_path):
+    """Fixture sets transcripts location to tmp_path and return the path."""
     config.ols_config.user_data_collection = UserDataCollection(
-        transcripts_disabled=False, transcripts_storage=tmpdir.strpath
+        transcripts_disabled=False, transcripts_storage=str(tmp_path)
     )
-    return tmpdir.strpath
+    return str(tmp_path)
 
 
-def test_transcripts_are_not_stored_when_disabled(transcripts_location, auth):
+def test_transcripts_are_not_stored_when_disabled(
+    transcripts_location, auth, make_llm_request
+):
     """Test nothing is stored when the transcript collection is disabled."""
-    with (
-        patch(
-            "ols.app.endpoints.ols.config.ols_config.user_data_collection.transcripts_disabled",
-            True,
-        ),
-        patch(
-            "ols.app.endpoints.ols.validate_question",
-            return_value=True,
-        ),
-        patch(
-            "ols.app.endpoints.ols.generate_response",
-            return_value=SummarizerResponse("something", [], False),
-        ),
-        patch(
-            "ols.app.endpoints.ols.store_conversation_history",
-            return_value=None,
-        ),
+    # the fixture installs fresh user data collection config for each test
+    config.ols_config.user_data_collection.transcripts_disabled = True
+    # nothing is asserted on the calls, so plain stand-ins are enough
+    summarizer_response = SummarizerResponse("something", [], False)
+    store_transcript = Mock(wraps=ols.store_transcript)
+    with patch.multiple(
+        ols,
+        validate_question=lambda *_: True,
+        generate_response=lambda *_: summarizer_response,
+        store_conversation_history=lambda *_: None,
+        store_transcript=store_transcript,
     ):
-        llm_request = LLMRequest(query="Tell me about Kubernetes")
+        llm_request = make_llm_request()
         response = ols.conversation_request(llm_request, auth)
         assert response
         assert response.response == "something"
 
-        transcript_dir = Path(transcripts_location)
-        assert list(transcript_dir.glob("*/*/*.json")) == []
+        # transcript is not even prepared
+        store_transcript.assert_not_called()
+
+        # nothing, not even the user directory, has been created
+        with os.scandir(transcripts_location) as entries:
+            assert next(entries, None) is None
 
 
 def test_construct_transcripts_path(transcripts_location):
@@ -861,13 +818,17 @@ def test_construct_transcripts_path(transcripts_location):
     assert str(path.resolve()).endswith(f"{user_id}/{conversation_id}")
 
 
-def test_store_transcript(transcripts_location):
+def test_store_transcript(
+    transcripts_location, conversation_id, make_llm_request, monkeypatch
+):
     """Test transcript is successfully stored."""
-    user_id = suid.get_suid()
-    conversation_id = suid.get_suid()
+    # freeze the time so the timestamp is known in advance
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    monkeypatch.setattr(ols, "datetime", Mock(now=Mock(return_value=now)))
+    user_id = "00000000-0000-0000-0000-000000000000"
     query_is_valid = True
     query = "Tell me about Kubernetes"
-    llm_request = LLMRequest(query=query, conversation_id=conversation_id)
+    llm_request = make_llm_request(conversation_id)
     response = "Kubernetes is ..."
     rag_chunks = [
         RagChunk("text1", "url1", "title1"),
@@ -898,22 +859,19 @@ def test_store_transcript(transcripts_location):
 
     # check file exists in the expected path
     assert transcript_dir.exists()
-    transcripts = list(transcript_dir.glob("*.json"))
+    with os.scandir(transcript_dir) as entries:
+        transcripts = [entry.path for entry in entries if entry.name.endswith(".json")]
     assert len(transcripts) == 1
 
     # check the transcript json content
-    with open(transcripts[0]) as f:
-        transcript = json.loads(f.read())
-    # we don't really care about the timestamp, so let's just set it to
-    # a fixed value
-    transcript["metadata"]["timestamp"] = "fake-timestamp"
+    transcript = json.loads(Path(transcripts[0]).read_bytes())
     assert transcript == {
         "metadata": {
             "provider": None,
             "model": None,
             "user_id": user_id,
             "conversation_id": conversation_id,
-            "timestamp": "fake-timestamp",
+            "timestamp": "2024-01-01T00:00:00+00:00",
         },
         "redacted_query": query,
         "query_is_valid": query_is_valid,
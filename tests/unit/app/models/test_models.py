@@ -18,6 +18,9 @@ from ols.app.models.models import (
 )
 from ols.utils import suid
 
+# feedback tests only round-trip the conversation ID, so one valid ID is enough
+CONVERSATION_ID = suid.get_suid()
+
 
 class TestLLM:
     """Unit tests for the LLMRequest/LLMResponse models."""
@@ -54,21 +57,27 @@ class TestLLM:
         assert llm_request.model == model
 
     @staticmethod
-    def test_llm_request_provider_and_model():
+    @pytest.mark.parametrize(
+        "provider, model, expected_message",
+        (
+            # model set and provider not
+            (
+                None,
+                "davinci",
+                "LLM provider must be specified when the model is specified.",
+            ),
+            # provider set and model not
+            (
+                "openai",
+                None,
+                "LLM model must be specified when the provider is specified.",
+            ),
+        ),
+    )
+    def test_llm_request_provider_and_model(provider, model, expected_message):
         """Test the LLMRequest model with provider and model."""
-        # model set and provider not
-        with pytest.raises(
-            ValidationError,
-            match="LLM provider must be specified when the model is specified.",
-        ):
-            LLMRequest(query="bla", provider=None, model="davinci")
-
-        # provider set and model not
-        with pytest.raises(
-            ValidationError,
-            match="LLM model must be specified when the provider is specified.",
-        ):
-            LLMRequest(query="bla", provider="openai", model=None)
+        with pytest.raises(ValidationError, match=expected_message):
+            LLMRequest(query="bla", provider=provider, model=model)
 
     @staticmethod
     def test_llm_response():
@@ -115,7 +124,7 @@ class TestFeedback:
     @staticmethod
     def test_feedback_request():
         """Test the FeedbackRequest model."""
-        conversation_id = suid.get_suid()
+        conversation_id = CONVERSATION_ID
         user_question = "user question"
         llm_response = "llm response"
         sentiment = 1
@@ -138,7 +147,7 @@ class TestFeedback:
     @staticmethod
     def test_feedback_request_optional_fields():
         """Test either sentiment or user_feedback needs to be set."""
-        conversation_id = suid.get_suid()
+        conversation_id = CONVERSATION_ID
         user_question = "user question"
         llm_response = "llm response"
         sentiment = 1
@@ -190,92 +199,52 @@ class TestFeedback:
             )
 
     @staticmethod
-    def test_feedback_sentiment():
+    @pytest.mark.parametrize(
+        "sentiment, user_feedback, expected",
+        (
+            (1, None, 1),
+            (-1, None, -1),
+            (None, "user feedback", None),
+            # can convert strings
+            ("1", None, 1),
+        ),
+    )
+    def test_feedback_sentiment(sentiment, user_feedback, expected):
         """Test the sentiment field of the FeedbackRequest model."""
-        conversation_id = suid.get_suid()
-        user_question = "user question"
-        llm_response = "llm response"
-
-        feedback_request = FeedbackRequest(
-            conversation_id=conversation_id,
-            user_question=user_question,
-            llm_response=llm_response,
-            sentiment=1,
-        )
-        assert feedback_request.sentiment == 1
-
-        feedback_request = FeedbackRequest(
-            conversation_id=conversation_id,
-            user_question=user_question,
-            llm_response=llm_response,
-            sentiment=-1,
-        )
-        assert feedback_request.sentiment == -1
-
-        feedback_request = FeedbackRequest(
-            conversation_id=conversation_id,
-            user_question=user_question,
-            llm_response=llm_response,
-            sentiment=None,
-            user_feedback="user feedback",
-        )
-        assert feedback_request.sentiment is None
-
-        # can convert strings
         feedback_request = FeedbackRequest(
-            conversation_id=conversation_id,
-            user_question=user_question,
-            llm_response=llm_response,
-            sentiment="1",
+            conversation_id=CONVERSATION_ID,
+            user_question="user question",
+            llm_response="llm response",
+            sentiment=sentiment,
+            user_feedback=user_feedback,
         )
-        assert feedback_request.sentiment == 1
+        assert feedback_request.sentiment == expected
 
-        # check some invalid values
-        with pytest.raises(
-            ValidationError, match="Improper value 2, needs to be -1 or 1"
-        ):
-            FeedbackRequest(
-                conversation_id=conversation_id,
-                user_question=user_question,
-                llm_response=llm_response,
-                sentiment=2,
-            )
-
-        with pytest.raises(
-            ValidationError, match="Improper value 0, needs to be -1 or 1"
-        ):
-            FeedbackRequest(
-                conversation_id=conversation_id,
-                user_question=user_question,
-                llm_response=llm_response,
-                sentiment=0,
-            )
-
-        with pytest.raises(
-            ValidationError, match="Improper value 2, needs to be -1 or 1"
-        ):
-            FeedbackRequest(
-                conversation_id=conversation_id,
-                user_question=user_question,
-                llm_response=llm_response,
-                sentiment="2",
-            )
-
-        with pytest.raises(ValidationError, match="Input should be a valid integer"):
-            FeedbackRequest(
-                conversation_id=conversation_id,
-                user_question=user_question,
-                llm_response=llm_response,
-                sentiment="",
-            )
-
-        with pytest.raises(ValidationError, match="Input should be a valid integer"):
+    @staticmethod
+    @pytest.mark.parametrize(
+        "sentiment, expected_message",
+        (
+            (2, "Improper value 2, needs to be -1 or 1"),
+            (0, "Improper value 0, needs to be -1 or 1"),
+            ("2", "Improper value 2, needs to be -1 or 1"),
+            ("", "Input should be a valid integer"),
+            ("foo", "Input should be a valid integer"),
+        ),
+    )
+    def test_feedback_sentiment_invalid(sentiment, expected_message):
+        """Test invalid values of the sentiment field of the FeedbackRequest model."""
+        with pytest.raises(ValidationError) as excinfo:
             FeedbackRequest(
-                conversation_id=conversation_id,
-                user_question=user_question,
-                llm_response=llm_response,
-                sentiment="foo",
+                conversation_id=CONVERSATION_ID,
+                user_question="user question",
+                llm_response="llm response",
+                sentiment=sentiment,
             )
+        # only the sentiment field is wrong
+        errors = excinfo.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"] == ("sentiment",)
+        assert expected_message in errors[0]["msg"]
 
     @staticmethod
     def test_feedback_response():
@@ -346,21 +315,28 @@ class TestCacheEntry:
     @staticmethod
     def test_from_dict():
         """Test the from_dict method of the CacheEntry model."""
-        attachment = Attachment(
-            attachment_type="log",
-            content_type="text/plain",
-            content="this is attachment",
-        )
         cache_entry = CacheEntry.from_dict(
             {
                 "human_query": "query",
                 "ai_response": "response",
-                "attachments": [attachment.model_dump()],
+                "attachments": [
+                    {
+                        "attachment_type": "log",
+                        "content_type": "text/plain",
+                        "content": "this is attachment",
+                    }
+                ],
             }
         )
         assert cache_entry.query == "query"
         assert cache_entry.response == "response"
-        assert cache_entry.attachments == [attachment]
+        assert cache_entry.attachments == [
+            Attachment(
+                attachment_type="log",
+                content_type="text/plain",
+                content="this is attachment",
+            )
+        ]
 
     @staticmethod
     def test_cache_entries_to_history():
@@ -414,6 +390,14 @@ class TestCacheEntry:
         ]
 
 
+# referenced documents are frozen, so the expected ones can be built just once
+EXPECTED_REFERENCED_DOCUMENTS = [
+    ReferencedDocument(docs_url="url2", title="title2"),
+    ReferencedDocument(docs_url="url1", title="title1"),
+    ReferencedDocument(docs_url="url3", title="title3"),
+]
+
+
 def test_ref_docs_from_rag_chunks():
     """Test the ReferencedDocument model method `from_rag_chunks`."""
     # urls are unsorted to ensure there is not a hidden sorting
@@ -425,10 +409,5 @@ def test_ref_docs_from_rag_chunks():
     ref_docs = ReferencedDocument.from_rag_chunks(
         [rag_chunk_1, rag_chunk_2, rag_chunk_3, rag_chunk_4]
     )
-    expected = [
-        ReferencedDocument(docs_url="url2", title="title2"),
-        ReferencedDocument(docs_url="url1", title="title1"),
-        ReferencedDocument(docs_url="url3", title="title3"),
-    ]
 
-    assert ref_docs == expected
+    assert ref_docs == EXPECTED_REFERENCED_DOCUMENTS
@@ -1,7 +1,7 @@
 """Unit tests for PostgresCache class."""
 
 import json
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import Mock, call, patch
 
 import psycopg2
 import pytest
@@ -18,6 +18,14 @@ cache_entry_1 = CacheEntry(query="用户消息", response="人工智能信息")
 cache_entry_2 = CacheEntry(query="user message", response="ai message")
 
 
+def _mock_cursor(mock_connect, fetchone=None):
+    """Return cursor mock handed out by the mocked connection's cursor context."""
+    mock_cursor = Mock(spec=psycopg2.extensions.cursor)
+    mock_cursor.fetchone.return_value = fetchone
+    mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+    return mock_cursor
+
+
 @patch("psycopg2.connect")
 def test_init_cache_failure_detection(mock_connect):
     """Test the exception handling for Cache.initialize_cache operation."""
@@ -39,9 +47,7 @@ def test_init_cache_failure_detection(mock_connect):
 def test_get_operation_on_empty_cache(mock_connect):
     """Test the Cache.get operation on empty cache."""
     # mock the query result - empty cache
-    mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = None
-    mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+    mock_cursor = _mock_cursor(mock_connect, fetchone=None)
 
     # initialize Postgres cache
     config = PostgresConfig()
@@ -60,9 +66,7 @@ def test_get_operation_on_empty_cache(mock_connect):
 def test_get_operation_invalid_value(mock_connect):
     """Test the Cache.get operation when invalid value is returned from cache."""
     # mock the query result
-    mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = "Invalid value"
-    mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+    mock_cursor = _mock_cursor(mock_connect, fetchone="Invalid value")
 
     # initialize Postgres cache
     config = PostgresConfig()
@@ -89,9 +93,7 @@ def test_get_operation_valid_value(mock_connect):
     conversation = json.dumps([ce.to_dict() for ce in history])
 
     # mock the query result
-    mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = (conversation,)
-    mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+    mock_cursor = _mock_cursor(mock_connect, fetchone=(conversation,))
 
     # initialize Postgres cache
     config = PostgresConfig()
@@ -116,9 +118,8 @@ def test_get_operation_on_exception(mock_connect):
     cache = PostgresCache(config)
 
     # mock the query
-    mock_cursor = MagicMock()
+    mock_cursor = _mock_cursor(mock_connect)
     mock_cursor.fetchone.side_effect = psycopg2.DatabaseError("PLSQL error")
-    mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
 
     # error must be raised during cache operation
     with pytest.raises(CacheError, match="PLSQL error"):
@@ -132,9 +133,7 @@ def test_insert_or_append_operation(mock_connect):
     conversation = json.dumps([history.to_dict()])
 
     # mock the query result
-    mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = None
-    mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+    mock_cursor = _mock_cursor(mock_connect, fetchone=None)
 
     # initialize Postgres cache
     config = PostgresConfig()
@@ -144,7 +143,7 @@ def test_insert_or_append_operation(mock_connect):
     # to insert new conversation history
     cache.insert_or_append(user_id, conversation_id, history)
 
-    # multiple DB operations must be performed
+    # multiple DB operations must be performed in this order
     calls = [
         call(
             PostgresCache.SELECT_CONVERSATION_HISTORY_STATEMENT,
@@ -156,7 +155,7 @@ def test_insert_or_append_operation(mock_connect):
         ),
         call(PostgresCache.QUERY_CACHE_SIZE),
     ]
-    mock_cursor.execute.assert_has_calls(calls, any_order=True)
+    assert mock_cursor.execute.call_args_list == calls
 
 
 @patch("psycopg2.connect")
@@ -174,9 +173,7 @@ def test_insert_or_append_operation_append_item(mock_connect):
     new_conversation = json.dumps(whole_history)
 
     # mock the query result
-    mock_cursor = MagicMock()
-    mock_cursor.fetchone.return_value = (old_conversation,)
-    mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+    mock_cursor = _mock_cursor(mock_connect, fetchone=(old_conversation,))
 
     # initialize Postgres cache
     config = PostgresConfig()
@@ -186,7 +183,7 @@ def test_insert_or_append_operation_append_item(mock_connect):
     # to append new history to the old one
     cache.insert_or_append(user_id, conversation_id, appended_history)
 
-    # multiple DB operations must be performed
+    # multiple DB operations must be performed in this order
     calls = [
         call(
             PostgresCache.SELECT_CONVERSATION_HISTORY_STATEMENT,
@@ -197,7 +194,7 @@ def test_insert_or_append_operation_append_item(mock_connect):
             (new_conversation.encode("utf-8"), user_id, conversation_id),
         ),
     ]
-    mock_cursor.execute.assert_has_calls(calls, any_order=True)
+    assert mock_cursor.execute.call_args_list == calls
 
 
 @patch("psycopg2.connect")
@@ -206,9 +203,8 @@ def test_insert_or_append_operation_on_exception(mock_connect):
     history = cache_entry_1
 
     # mock the query result
-    mock_cursor = MagicMock()
+    mock_cursor = _mock_cursor(mock_connect)
     mock_cursor.fetchone.side_effect = psycopg2.DatabaseError("PLSQL error")
-    mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
 
     # initialize Postgres cache
     config = PostgresConfig()
@@ -1,7 +1,8 @@
 """Unit tests for DocsSummarizer class."""
 
+import copy
 import logging
-from unittest.mock import ANY, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -18,6 +19,9 @@ from tests.mock_classes.mock_llm_loader import mock_llm_loader
 
 conversation_id = suid.get_suid()
 
+# the mocked chain echoes the query back, no test needs a different one
+MOCK_LLM_CHAIN = mock_llm_chain(None)
+
 
 def test_is_query_helper_subclass():
     """Test that DocsSummarizer is a subclass of QueryHelper."""
@@ -36,15 +40,41 @@ def check_summary_result(summary, question):
     assert summary.history_truncated is False
 
 
+@pytest.fixture(scope="module")
+def _parsed_config():
+    """Parse and validate config for tests only once."""
+    config.reload_from_yaml_file("tests/config/valid_config.yaml")
+    return copy.deepcopy(config.config)
+
+
 @pytest.fixture(scope="function", autouse=True)
-def _setup():
+def _setup(_parsed_config):
     """Set up config for tests."""
-    config.reload_from_yaml_file("tests/config/valid_config.yaml")
+    config.reload_from_config(copy.deepcopy(_parsed_config))
+
+
+@pytest.fixture(scope="module")
+def summarizer(_parsed_config):
+    """DocsSummarizer with mocked LLM loader, constructed once per module."""
+    return DocsSummarizer(llm_loader=mock_llm_loader(None))
+
+
+@pytest.fixture(scope="module")
+def rag_index():
+    """Return mocked index, it is only read by the summarizer."""
+    return MockLlamaIndex()
 
 
-def test_if_system_prompt_was_updated():
+@pytest.fixture(autouse=True)
+def _mock_llm_chain(monkeypatch):
+    """Replace LLM chain used by DocsSummarizer in all tests."""
+    monkeypatch.setattr(
+        "ols.src.query_helpers.docs_summarizer.LLMChain", MOCK_LLM_CHAIN
+    )
+
+
+def test_if_system_prompt_was_updated(summarizer):
     """Test if system prompt was overided from the configuration."""
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
     # expected prompt was loaded during configuration phase
     expected_prompt = config.ols_config.system_prompt
     assert summarizer.system_prompt == expected_prompt
@@ -52,12 +82,9 @@ def test_if_system_prompt_was_updated():
 
 @patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4)
 @patch("ols.utils.token_handler.MINIMUM_CONTEXT_TOKEN_LIMIT", 1)
-@patch("ols.src.query_helpers.docs_summarizer.LLMChain", new=mock_llm_chain(None))
-def test_summarize_empty_history():
+def test_summarize_empty_history(summarizer, rag_index):
     """Basic test for DocsSummarizer using mocked index and query engine."""
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
     question = "What's the ultimate question with answer 42?"
-    rag_index = MockLlamaIndex()
     history = []  # empty history
     summary = summarizer.summarize(conversation_id, question, rag_index, history)
     check_summary_result(summary, question)
@@ -65,12 +92,9 @@ def test_summarize_empty_history():
 
 @patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4)
 @patch("ols.utils.token_handler.MINIMUM_CONTEXT_TOKEN_LIMIT", 3)
-@patch("ols.src.query_helpers.docs_summarizer.LLMChain", new=mock_llm_chain(None))
-def test_summarize_no_history():
+def test_summarize_no_history(summarizer, rag_index):
     """Basic test for DocsSummarizer using mocked index and query engine, no history is provided."""
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
     question = "What's the ultimate question with answer 42?"
-    rag_index = MockLlamaIndex()
     # no history is passed into summarize() method
     summary = summarizer.summarize(conversation_id, question, rag_index)
     check_summary_result(summary, question)
@@ -78,40 +102,31 @@ def test_summarize_no_history():
 
 @patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4)
 @patch("ols.utils.token_handler.MINIMUM_CONTEXT_TOKEN_LIMIT", 3)
-@patch("ols.src.query_helpers.docs_summarizer.LLMChain", new=mock_llm_chain(None))
-def test_summarize_history_provided():
+def test_summarize_history_provided(summarizer, rag_index):
     """Basic test for DocsSummarizer using mocked index and query engine, history is provided."""
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
     question = "What's the ultimate question with answer 42?"
     history = ["human: What is Kubernetes?"]
-    rag_index = MockLlamaIndex()
 
-    # first call with history provided
     with patch(
         "ols.src.query_helpers.docs_summarizer.TokenHandler.limit_conversation_history",
         return_value=([], False),
     ) as token_handler:
+        # first call with history provided
         summary1 = summarizer.summarize(conversation_id, question, rag_index, history)
-        token_handler.assert_called_once_with(history, ANY, ANY)
         check_summary_result(summary1, question)
 
-    # second call without history provided
-    with patch(
-        "ols.src.query_helpers.docs_summarizer.TokenHandler.limit_conversation_history",
-        return_value=([], False),
-    ) as token_handler:
+        # second call without history provided
         summary2 = summarizer.summarize(conversation_id, question, rag_index)
-        token_handler.assert_called_once_with([], ANY, ANY)
         check_summary_result(summary2, question)
 
+        # only the history passed to the token handler matters
+        assert [c.args[0] for c in token_handler.call_args_list] == [history, []]
+
 
 @patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4)
-@patch("ols.src.query_helpers.docs_summarizer.LLMChain", new=mock_llm_chain(None))
-def test_summarize_truncation():
+def test_summarize_truncation(summarizer, rag_index):
     """Basic test for DocsSummarizer to check if truncation is done."""
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
     question = "What's the ultimate question with answer 42?"
-    rag_index = MockLlamaIndex()
 
     # too long history
     history = ["human: What is Kubernetes?"] * 10000
@@ -121,7 +136,6 @@ def test_summarize_truncation():
     assert summary.history_truncated
 
 
-@patch("ols.src.query_helpers.docs_summarizer.LLMChain", new=mock_llm_chain(None))
 def test_summarize_no_reference_content():
     """Basic test for DocsSummarizer using mocked index and query engine."""
     summarizer = DocsSummarizer(
@@ -136,8 +150,7 @@ def test_summarize_no_reference_content():
 
 @patch("ols.utils.token_handler.RAG_SIMILARITY_CUTOFF", 0.4)
 @patch("ols.utils.token_handler.MINIMUM_CONTEXT_TOKEN_LIMIT", 3)
-@patch("ols.src.query_helpers.docs_summarizer.LLMChain", new=mock_llm_chain(None))
-def test_summarize_reranker(caplog):
+def test_summarize_reranker(summarizer, rag_index, caplog):
     """Basic test to make sure the reranker is called as expected."""
     logging_config = LoggingConfig(app_log_level="debug")
 
@@ -145,9 +158,7 @@ def test_summarize_reranker(caplog):
     logger = logging.getLogger("ols")
     logger.handlers = [caplog.handler]  # add caplog handler to logger
 
-    summarizer = DocsSummarizer(llm_loader=mock_llm_loader(None))
     question = "What's the ultimate question with answer 42?"
-    rag_index = MockLlamaIndex()
     # no history is passed into summarize() method
     summary = summarizer.summarize(conversation_id, question, rag_index)
     check_summary_result(summary, question)
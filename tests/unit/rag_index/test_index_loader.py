@@ -1,16 +1,43 @@
 """Unit test for the index loader module."""
 
+import logging
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
-from ols import config
+import pytest
+
 from ols.app.models.config import ReferenceContent
 from ols.src.rag_index.index_loader import IndexLoader
 from tests.mock_classes.mock_llama_index import MockLlamaIndex
 
 
+@pytest.fixture
+def reference_content():
+    """Return reference content configuration with index path set."""
+    reference_content = ReferenceContent(None)
+    reference_content.product_docs_index_path = Path("./some_dir")
+    return reference_content
+
+
+@pytest.fixture
+def llama_patches():
+    """Patch llama_index storage loading for the duration of a test."""
+    with (
+        patch("llama_index.core.StorageContext.from_defaults") as storage_context,
+        patch(
+            "llama_index.vector_stores.faiss.FaissVectorStore.from_persist_dir"
+        ) as from_persist_dir,
+        patch("llama_index.core.load_index_from_storage", new=MockLlamaIndex),
+    ):
+        yield SimpleNamespace(
+            storage_context=storage_context, from_persist_dir=from_persist_dir
+        )
+
+
 def test_index_loader_empty_config(caplog):
     """Test index loader with empty/None config."""
+    caplog.set_level(logging.WARNING, logger="ols.src.rag_index.index_loader")
     index_loader_obj = IndexLoader(None)
     index = index_loader_obj.vector_index
 
@@ -20,12 +47,9 @@ def test_index_loader_empty_config(caplog):
 
 
 @patch("llama_index.core.StorageContext.from_defaults")
-def test_index_loader_no_id(storage_context):
+def test_index_loader_no_id(storage_context, reference_content):
     """Test index loader without index id."""
-    config.ols_config.reference_content = ReferenceContent(None)
-    config.ols_config.reference_content.product_docs_index_path = Path("./some_dir")
-
-    index_loader_obj = IndexLoader(config.ols_config.reference_content)
+    index_loader_obj = IndexLoader(reference_content)
     index = index_loader_obj.vector_index
 
     assert (
@@ -34,18 +58,13 @@ def test_index_loader_no_id(storage_context):
     assert index is None
 
 
-@patch("llama_index.core.StorageContext.from_defaults")
-@patch("llama_index.vector_stores.faiss.FaissVectorStore.from_persist_dir")
-@patch("llama_index.core.load_index_from_storage", new=MockLlamaIndex)
-def test_index_loader(storage_context, from_persist_dir):
+def test_index_loader(llama_patches, reference_content):
     """Test index loader."""
-    config.ols_config.reference_content = ReferenceContent(None)
-    config.ols_config.reference_content.product_docs_index_path = Path("./some_dir")
-    config.ols_config.reference_content.product_docs_index_id = "./some_id"
+    reference_content.product_docs_index_id = "./some_id"
 
-    from_persist_dir.return_value = None
+    llama_patches.from_persist_dir.return_value = None
 
-    index_loader_obj = IndexLoader(config.ols_config.reference_content)
+    index_loader_obj = IndexLoader(reference_content)
     index = index_loader_obj.vector_index
 
     assert isinstance(index, MockLlamaIndex)
@@ -1,5 +1,6 @@
 """Unit tests for the data_collector module."""
 
+import io
 import logging
 import os
 import pathlib
@@ -109,6 +110,18 @@ def test_delete_data(tmp_path):
     assert len(list(tmp_path.iterdir())) == 0
 
 
+def test_delete_data_many_files(tmp_path):
+    """Test the delete_data function with files deleted in parallel."""
+    files = [tmp_path / f"{i}.json" for i in range(20)]
+    for file in files:
+        file.write_text("something")
+    assert len(list(tmp_path.iterdir())) == 20
+
+    data_collector.delete_data(files)
+
+    assert len(list(tmp_path.iterdir())) == 0
+
+
 def mock_collect_ols_data_from(data_path: str) -> list[pathlib.Path]:
     """Mock collect_ols_data_from function."""
     # call the original function and get its result
@@ -236,3 +249,71 @@ def test_access_token_from_offline_token():
     with patch("requests.post", return_value=Response()):
         with pytest.raises(Exception, match="Response is not JSON"):
             data_collector.access_token_from_offline_token("offline_token")
+
+
+@pytest.fixture
+def _reset_ingress_auth_headers():
+    """Start and finish test without cached Ingress authentication headers."""
+    data_collector.reset_ingress_auth_headers()
+    yield
+    data_collector.reset_ingress_auth_headers()
+
+
+@pytest.mark.usefixtures("_reset_ingress_auth_headers")
+def test_upload_data_to_ingress_reuses_token_on_retry():
+    """Test that the token is not regenerated for every upload retry."""
+    failed_response = Mock(spec=Response)
+    failed_response.status_code = 500
+    failed_response.text = "internal error"
+
+    with (
+        patch(
+            "ols.user_data_collection.data_collector.access_token_from_offline_token",
+            return_value="token",
+        ) as mock_access_token,
+        patch("ols.user_data_collection.data_collector.requests.Session") as session,
+        patch("ols.user_data_collection.data_collector.time.sleep"),
+    ):
+        mock_post = session.return_value.__enter__.return_value.post
+        mock_post.side_effect = [failed_response, mock_ingress_response()]
+        data_collector.upload_data_to_ingress(io.BytesIO(b"data"))
+
+    assert mock_post.call_count == 2
+    mock_access_token.assert_called_once()
+    # the same data are sent on retry
+    for call in mock_post.call_args_list:
+        assert call.kwargs["files"]["file"][1] == b"data"
+
+
+@pytest.mark.usefixtures("_reset_ingress_auth_headers")
+def test_upload_data_to_ingress_refreshes_token_on_unauthorized():
+    """Test that the token is regenerated when Ingress refuses it."""
+    unauthorized_response = Mock(spec=Response)
+    unauthorized_response.status_code = 401
+    unauthorized_response.text = "unauthorized"
+
+    with (
+        patch(
+            "ols.user_data_collection.data_collector.access_token_from_offline_token",
+            return_value="token",
+        ) as mock_access_token,
+        patch("ols.user_data_collection.data_collector.requests.Session") as session,
+        patch("ols.user_data_collection.data_collector.time.sleep"),
+    ):
+        mock_post = session.return_value.__enter__.return_value.post
+        mock_post.side_effect = [unauthorized_response, mock_ingress_response()]
+        data_collector.upload_data_to_ingress(io.BytesIO(b"data"))
+
+    assert mock_post.call_count == 2
+    assert mock_access_token.call_count == 2
+
+
+def test_disabled_by_file(tmp_path):
+    """Test that the collection is disabled by existence of the control file."""
+    disable_collector_file = os.path.join(
+        tmp_path, data_collector.DISABLE_COLLECTOR_FILE_NAME
+    )
+    assert not data_collector.disabled_by_file(disable_collector_file)
+
+    pathlib.Path(disable_collector_file).touch()
+    assert data_collector.disabled_by_file(disable_collector_file)
@@ -1055,6 +1055,21 @@ def test_valid_config_without_query_filter():
     assert config.query_redactor.regex_filters == []
 
 
+def test_reload_from_config():
+    """Check that already validated configuration can be installed."""
+    config.reload_from_yaml_file("tests/config/valid_config.yaml")
+    expected_config = config.config
+    config._query_filters = "cached value"
+    config._rag_index = "cached value"
+
+    config.reload_empty()
+    config.reload_from_config(expected_config)
+    assert config.config is expected_config
+    # cached values must be reset
+    assert config._query_filters is None
+    assert config._rag_index is None
+
+
 def test_valid_config_with_query_filter():
     """Check if a valid configuration file with query filter is handled correctly."""
     config.reload_empty()
@@ -4,9 +4,9 @@ import logging
 from unittest.mock import MagicMock, patch
 
 import pytest
-from requests.exceptions import RequestException
 
 from ols.utils.pyroscope import (
+    pyroscope_server_address,
     start_with_pyroscope_enabled,
 )
 
@@ -37,7 +37,7 @@ def mock_logger():
 def test_pyroscope_server_reachable(mock_config, mock_logger):
     """Test that Pyroscope starts when the server is reachable."""
     with (
-        patch("ols.utils.pyroscope.requests.get") as mock_get,
+        patch("ols.utils.pyroscope.socket.create_connection") as mock_connect,
         patch("ols.runners.uvicorn.uvicorn.run") as mock_run,
         patch("ols.utils.pyroscope.threading.Thread") as mock_thread,
         patch.dict("sys.modules", {"pyroscope": MagicMock()}) as mock_pyroscope_module,
@@ -45,10 +45,9 @@ def test_pyroscope_server_reachable(mock_config, mock_logger):
         mock_pyroscope = mock_pyroscope_module["pyroscope"]
         mock_pyroscope.configure = MagicMock()
 
-        mock_get.return_value.status_code = 200
-
         start_with_pyroscope_enabled(mock_config, mock_logger)
 
+        mock_connect.assert_called_once_with(("mock-pyroscope-url", 80), timeout=2)
         mock_logger.info.assert_any_call(
             "Pyroscope server is reachable at %s", mock_config.dev_config.pyroscope_url
         )
@@ -59,24 +58,43 @@ def test_pyroscope_server_reachable(mock_config, mock_logger):
 
 def test_pyroscope_server_unreachable(mock_config, mock_logger):
     """Test that Pyroscope logs a failure when the server is unreachable."""
-    with patch("ols.utils.pyroscope.requests.get") as mock_get:
-        mock_get.return_value.status_code = 500
-
+    with (
+        patch(
+            "ols.utils.pyroscope.socket.create_connection",
+            side_effect=ConnectionRefusedError("Connection refused"),
+        ),
+        patch("ols.runners.uvicorn.uvicorn.run") as mock_run,
+    ):
         start_with_pyroscope_enabled(mock_config, mock_logger)
 
         mock_logger.info.assert_any_call(
-            "Failed to reach Pyroscope server. Status code: %d", 500
+            "Error connecting to Pyroscope server: %s", "Connection refused"
         )
+        mock_run.assert_not_called()
 
 
-def test_pyroscope_connection_error(mock_config, mock_logger):
-    """Test that Pyroscope handles connection errors gracefully."""
+def test_pyroscope_connection_timeout(mock_config, mock_logger):
+    """Test that Pyroscope handles connection timeout gracefully."""
     with patch(
-        "ols.utils.pyroscope.requests.get",
-        side_effect=RequestException("Connection error"),
+        "ols.utils.pyroscope.socket.create_connection",
+        side_effect=TimeoutError("timed out"),
     ):
         start_with_pyroscope_enabled(mock_config, mock_logger)
 
         mock_logger.info.assert_any_call(
-            "Error connecting to Pyroscope server: %s", "Connection error"
+            "Error connecting to Pyroscope server: %s", "timed out"
         )
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    (
+        ("http://pyroscope", ("pyroscope", 80)),
+        ("https://pyroscope", ("pyroscope", 443)),
+        ("http://pyroscope:4040", ("pyroscope", 4040)),
+        ("https://pyroscope:4040/path", ("pyroscope", 4040)),
+    ),
+)
+def test_pyroscope_server_address(url, expected):
+    """Test that host and port are parsed from Pyroscope URL."""
+    assert pyroscope_server_address(url) == expected